@@ -0,0 +1,72 @@
+"""Ahead-of-time build of the PMI v3 numba kernels
+
+Run from project root (requires numba):
+  python -m backend.scrapers._compile
+
+Writes backend/scrapers/_pmi_kernels.<platform>.so. pmi_v3_engine picks it
+up on import, so short-lived scraper runs get native kernels without paying
+the first-call JIT compile. Without the extension the engine uses its JIT
+(or plain Python) kernels, with identical results. Rebuild after changing
+any of the kernels or the constants they read; a stale build is detected
+by its source fingerprint and ignored with a warning.
+
+Supported numba: >=0.57,<0.69 (built and tested with 0.68). numba.pycc has
+been pending deprecation since 0.57 and is slated for removal, so a newer
+numba may not ship it; the engine then simply keeps its JIT kernels.
+"""
+
+from pathlib import Path
+
+OUT_DIR = Path(__file__).parent
+MODULE_NAME = "_pmi_kernels"
+
+
+def main():
+    try:
+        from numba.pycc import CC
+    except ImportError as exc:
+        raise SystemExit(
+            f"❌ numba.pycc is unavailable ({exc}); install numba>=0.57,<0.69 "
+            "to build the AOT kernels. The engine works without them."
+        )
+
+    # Drop a stale build first so the engine imports its JIT kernels,
+    # which are the sources compiled below
+    for stale in OUT_DIR.glob(f"{MODULE_NAME}.*"):
+        if stale.suffix in (".so", ".pyd"):
+            stale.unlink()
+
+    from backend.scrapers import pmi_v3_engine as engine
+
+    cc = CC(MODULE_NAME)
+    cc.output_dir = str(OUT_DIR)
+
+    cc.export(
+        "pmi_season",
+        "UniTuple(f8, 3)(f8, f8, f8, f8, f8, f8, f8, f8, f8, f8, "
+        "f8[:], f8[:], f8[:], f8, f8)",
+    )(engine._compute_pmi_season_nb.py_func)
+    cc.export(
+        "career_sums",
+        "UniTuple(f8, 3)(f8[:], f8[:], f8[:])",
+    )(engine._career_sums_nb.py_func)
+    cc.export(
+        "welford_means_stds",
+        "Tuple((f8[:], f8[:], i8[:]))(f8[:, :])",
+    )(engine._welford_means_stds.py_func)
+
+    # Source fingerprint, checked by the engine on import
+    fingerprint = engine._kernel_fingerprint()
+
+    def kernel_fingerprint():
+        return fingerprint
+
+    cc.export("kernel_fingerprint", "i8()")(kernel_fingerprint)
+
+    print(f"🔧 Compiling {MODULE_NAME} → {OUT_DIR}")
+    cc.compile()
+    print("✅ Done")
+
+
+if __name__ == "__main__":
+    main()
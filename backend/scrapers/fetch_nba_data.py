@@ -662,7 +662,7 @@ def compute_pmi(players: dict, season_data: dict):
     """
     from backend.scrapers.pmi_engine import (
         compute_opmi, compute_dpmi, _pos_num,
-        compute_season_league_stats, compute_awc,
+        compute_season_league_stats, compute_awc, LeagueStats,
     )
 
     # Pre-compute league stats from RAW season DataFrames (ALL players)
@@ -698,18 +698,20 @@ def compute_pmi(players: dict, season_data: dict):
                     "mpg": round(mpg, 1),
                 })
             if rows:
-                league_cache[(label, stype_key)] = compute_season_league_stats(pd.DataFrame(rows))
+                league_cache[(label, stype_key)] = LeagueStats.from_dict(
+                    compute_season_league_stats(pd.DataFrame(rows))
+                )
 
     print(f"  Cached {len(league_cache)} season-types")
 
-    fallback = {
-        "ppg_mean": 14.0, "ppg_std": 6.5, "apg_mean": 2.8, "apg_std": 2.5,
-        "tov_pg_mean": 1.5, "tov_pg_std": 0.8, "orb_pg_mean": 1.0, "orb_pg_std": 0.8,
-        "fta_pg_mean": 2.5, "fta_pg_std": 1.5, "fg3m_pg_mean": 0.5, "fg3m_pg_std": 0.6,
-        "spg_mean": 0.8, "spg_std": 0.5, "bpg_mean": 0.5, "bpg_std": 0.5,
-        "drb_pg_mean": 2.5, "drb_pg_std": 1.5, "pf_pg_mean": 2.2, "pf_pg_std": 0.8,
-        "ts_pct_mean": 0.540, "ts_pct_std": 0.05,
-    }
+    fallback = LeagueStats(
+        ppg_mean=14.0, ppg_std=6.5, apg_mean=2.8, apg_std=2.5,
+        tov_pg_mean=1.5, tov_pg_std=0.8, orb_pg_mean=1.0, orb_pg_std=0.8,
+        fta_pg_mean=2.5, fta_pg_std=1.5, fg3m_pg_mean=0.5, fg3m_pg_std=0.6,
+        spg_mean=0.8, spg_std=0.5, bpg_mean=0.5, bpg_std=0.5,
+        drb_pg_mean=2.5, drb_pg_std=1.5, pf_pg_mean=2.2, pf_pg_std=0.8,
+        ts_pct_mean=0.540, ts_pct_std=0.05,
+    )
 
     for p in players.values():
         pos_num = _pos_num(p["info"].get("position", "SF"))
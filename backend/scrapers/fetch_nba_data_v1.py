@@ -14,12 +14,15 @@ import json
 import time
 import logging
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional
 
 import pandas as pd
 import numpy as np
 
+from backend.scrapers.rate_limit import RateLimiter
+
 logger = logging.getLogger(__name__)
 DATA_DIR = Path(__file__).parent.parent / "data"
 
@@ -56,8 +59,12 @@ HEADERS = {
 #  NBA API HELPERS
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def _safe_api_call(func, *args, retries=4, delay=2.0, **kwargs):
-    """Call nba_api with retries, rate-limiting, and proper headers."""
+def _safe_api_call(func, *args, retries=4, delay=2.0, limiter=None, **kwargs):
+    """Call nba_api with retries, rate-limiting, and proper headers.
+
+    With a shared `limiter`, pacing is left to it instead of sleeping
+    `delay` after every successful call.
+    """
     # Always inject browser headers (required by NBA.com)
     kwargs["headers"] = HEADERS
     # Ensure reasonable timeout
@@ -66,6 +73,9 @@ def _safe_api_call(func, *args, retries=4, delay=2.0, **kwargs):
 
     for attempt in range(retries):
         try:
+            if limiter is not None:
+                limiter.wait()
+                return func(*args, **kwargs)
             result = func(*args, **kwargs)
             time.sleep(delay)  # Rate limit — NBA.com throttles fast requests
             return result
@@ -174,12 +184,14 @@ def fetch_player_career_totals(player_id: int) -> Optional[dict]:
 #  FETCH CLUTCH STATS
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def fetch_clutch_stats(season: str, season_type: str = "Regular Season") -> Optional[pd.DataFrame]:
+def fetch_clutch_stats(season: str, season_type: str = "Regular Season",
+                       limiter: Optional[RateLimiter] = None) -> Optional[pd.DataFrame]:
     """Fetch clutch stats for a season (last 5 min, ±5 pts)."""
     from nba_api.stats.endpoints import leaguedashplayerclutch
 
     result = _safe_api_call(
         leaguedashplayerclutch.LeagueDashPlayerClutch,
+        limiter=limiter,
         season=season,
         season_type_all_star=season_type,
         clutch_time="Last 5 Minutes",
@@ -301,59 +313,76 @@ def process_player_seasons(per_game_df: pd.DataFrame, player_info: dict,
 
 def compute_pmi_for_seasons(seasons_list: list, player_info: dict,
                             all_seasons_data: dict,
-                            is_playoff: bool = False) -> list:
+                            is_playoff: bool = False,
+                            league_cache: dict = None) -> list:
     """Compute PMI v3 for each season using league-wide z-scores.
 
     all_seasons_data: { season_label: [list of all player season dicts for that season] }
+    league_cache: optional { season_label: frozen league stats }, shared
+    across players so each season's league stats are computed once.
     """
     from backend.scrapers.pmi_v3_engine import (
-        compute_pmi_season, _pos_num,
-        compute_season_league_stats, compute_awc,
+        compute_pmi_seasons_batch, _pos_num,
+        compute_season_league_stats_np, compute_awc_vec, freeze_league_stats,
+        _league_columns,
     )
 
+    if not seasons_list:
+        return seasons_list
+    if league_cache is None:
+        league_cache = {}
+
     pos = player_info.get("position", "SF")
     pos_num = _pos_num(pos)
 
-    for season_dict in seasons_list:
+    years = [s.get("year", 2020) for s in seasons_list]
+    league_by_year = {}
+    for season_dict, year in zip(seasons_list, years):
         season = season_dict["season"]
-        year = season_dict.get("year", 2020)
 
         # Get league stats for this season
-        league_data = all_seasons_data.get(season, [])
-        if league_data:
-            league_df = pd.DataFrame(league_data)
-            league = compute_season_league_stats(league_df)
-        else:
-            # Fallback: use approximate league averages
-            league = {
-                "ppg_mean": 14.0, "ppg_std": 6.5,
-                "apg_mean": 2.8, "apg_std": 2.5,
-                "tov_pg_mean": 1.5, "tov_pg_std": 0.8,
-                "orb_pg_mean": 1.0, "orb_pg_std": 0.8,
-                "spg_mean": 0.8, "spg_std": 0.5,
-                "bpg_mean": 0.5, "bpg_std": 0.5,
-                "drb_pg_mean": 2.5, "drb_pg_std": 1.5,
-                "pf_pg_mean": 2.2, "pf_pg_std": 0.8,
-                "ts_pct_mean": 0.540, "ts_pct_std": 0.05,
-            }
-
-        result = compute_pmi_season(season_dict, league, pos_num, year)
-
-        # AWC for this season
-        total_min = round(season_dict["mpg"] * season_dict["gp"])
-        awc = compute_awc(result["pmi"], total_min)
-
-        season_dict["opmi"] = result["opmi"]
-        season_dict["dpmi"] = result["dpmi"]
-        season_dict["pmi"] = result["pmi"]
-        season_dict["awc"] = round(awc, 1)
-        season_dict["peak_pmi"] = result["pmi"]  # will be updated after all seasons
-
-    # Update peak_pmi to be the max PMI across all seasons
-    if seasons_list:
-        peak = max(s["pmi"] for s in seasons_list)
-        for s in seasons_list:
-            s["peak_pmi"] = round(peak, 2)
+        league = league_cache.get(season)
+        if league is None:
+            league_data = all_seasons_data.get(season, [])
+            if league_data:
+                league = compute_season_league_stats_np(*_league_columns(league_data))
+            else:
+                # Fallback: use approximate league averages
+                league = {
+                    "ppg_mean": 14.0, "ppg_std": 6.5,
+                    "apg_mean": 2.8, "apg_std": 2.5,
+                    "tov_pg_mean": 1.5, "tov_pg_std": 0.8,
+                    "orb_pg_mean": 1.0, "orb_pg_std": 0.8,
+                    "spg_mean": 0.8, "spg_std": 0.5,
+                    "bpg_mean": 0.5, "bpg_std": 0.5,
+                    "drb_pg_mean": 2.5, "drb_pg_std": 1.5,
+                    "pf_pg_mean": 2.2, "pf_pg_std": 0.8,
+                    "ts_pct_mean": 0.540, "ts_pct_std": 0.05,
+                }
+            league = league_cache[season] = freeze_league_stats(league)
+        league_by_year[int(year)] = league
+
+    # One array pass for every season; dicts are only touched to emit results
+    results = compute_pmi_seasons_batch(
+        pd.DataFrame(seasons_list, dtype=object), league_by_year, pos_num, years)
+
+    # AWC for every season
+    n = len(seasons_list)
+    total_min = np.round(
+        np.fromiter((s["mpg"] for s in seasons_list), dtype=np.float64, count=n)
+        * np.fromiter((s["gp"] for s in seasons_list), dtype=np.float64, count=n))
+    awcs = compute_awc_vec(results[:, 0], total_min)
+
+    for season_dict, (pmi, opmi, dpmi), awc in zip(seasons_list, results.tolist(), awcs.tolist()):
+        season_dict["opmi"] = opmi
+        season_dict["dpmi"] = dpmi
+        season_dict["pmi"] = pmi
+        season_dict["awc"] = awc
+
+    # peak_pmi is the max PMI across all seasons
+    peak = round(float(results[:, 0].max()), 2)
+    for s in seasons_list:
+        s["peak_pmi"] = peak
 
     return seasons_list
 
@@ -362,7 +391,9 @@ def build_career_summary(seasons: list, totals_df: Optional[pd.DataFrame],
                          player_info: dict, clutch_career: Optional[dict],
                          is_playoff: bool = False) -> dict:
     """Build PlayerData career summary from seasons + totals."""
-    from backend.scrapers.pmi_v3_engine import compute_career_pmi, compute_awc
+    from backend.scrapers.pmi_v3_engine import (
+        compute_career_pmi, compute_awc, _season_list_to_array,
+    )
 
     if not seasons:
         return {}
@@ -371,15 +402,10 @@ def build_career_summary(seasons: list, totals_df: Optional[pd.DataFrame],
     total_min = sum(round(s["mpg"] * s["gp"]) for s in seasons)
 
     # Career PMI (minutes-weighted + Bayesian regression)
-    career_pmi = compute_career_pmi(seasons, is_playoff)
-    career_opmi = compute_career_pmi(
-        [{"pmi": s["opmi"], "gp": s["gp"], "mpg": s["mpg"]} for s in seasons],
-        is_playoff
-    )
-    career_dpmi = compute_career_pmi(
-        [{"pmi": s["dpmi"], "gp": s["gp"], "mpg": s["mpg"]} for s in seasons],
-        is_playoff
-    )
+    season_arr = _season_list_to_array(seasons)
+    career_pmi = compute_career_pmi(season_arr, is_playoff)
+    career_opmi = compute_career_pmi(season_arr, is_playoff, field="opmi")
+    career_dpmi = compute_career_pmi(season_arr, is_playoff, field="dpmi")
 
     # Peak
     peak_season = max(seasons, key=lambda s: s["pmi"])
@@ -533,6 +559,18 @@ def fetch_player_info(player_id: int) -> Optional[dict]:
 #  MAIN INGESTION PIPELINE
 # ═══════════════════════════════════════════════════════════════════════════════
 
+CLUTCH_FETCH_WORKERS = 3
+CLUTCH_FETCH_RATE = 1.7  # requests/sec across all clutch workers
+
+
+def _sort_by_pmi(players: list[dict]) -> list[dict]:
+    """Order player summaries by career PMI, descending (stable)."""
+    keys = np.fromiter((p.get("pmi") or 0 for p in players),
+                       dtype=np.float64, count=len(players))
+    order = np.argsort(-keys, kind="stable")
+    return [players[i] for i in order]
+
+
 def run_ingestion(top_n: int = 100, min_seasons: int = 5, recent_seasons: int = 0):
     """Run the full data ingestion pipeline.
 
@@ -755,6 +793,8 @@ def run_ingestion(top_n: int = 100, min_seasons: int = 5, recent_seasons: int =
     players_playoffs = []
     seasons_regular = {}
     seasons_playoffs = {}
+    league_cache_regular = {}
+    league_cache_playoffs = {}
 
     for p_data in sorted_players:
         info = p_data["info"]
@@ -763,12 +803,14 @@ def run_ingestion(top_n: int = 100, min_seasons: int = 5, recent_seasons: int =
 
         # Compute PMI for regular seasons
         reg = compute_pmi_for_seasons(
-            p_data["regular"], info, all_regular_seasons, is_playoff=False
+            p_data["regular"], info, all_regular_seasons, is_playoff=False,
+            league_cache=league_cache_regular,
         )
 
         # Compute PMI for playoff seasons
         ply = compute_pmi_for_seasons(
-            p_data["playoffs"], info, all_playoff_seasons, is_playoff=True
+            p_data["playoffs"], info, all_playoff_seasons, is_playoff=True,
+            league_cache=league_cache_playoffs,
         )
 
         # Build career summaries (clutch added in Step 4b below)
@@ -799,7 +841,7 @@ def run_ingestion(top_n: int = 100, min_seasons: int = 5, recent_seasons: int =
     print("\n🔥 Step 4b: Fetching clutch stats and computing CPMI...")
 
     from backend.scrapers.pmi_v3_engine import (
-        compute_cpmi, compute_clutch_league_stats, build_clutch_row,
+        compute_cpmi_batch, compute_clutch_league_stats,
     )
 
     # Collect unique seasons across all players (only post-1996 have clutch data)
@@ -817,15 +859,26 @@ def run_ingestion(top_n: int = 100, min_seasons: int = 5, recent_seasons: int =
     clutch_league_by_season = {} # { season: league_stats_dict }
     clutch_fetched = 0
 
-    for season_label in sorted(all_season_labels):
-        clutch_df = fetch_clutch_stats(season_label)
-        if clutch_df is not None and not clutch_df.empty:
-            clutch_by_season[season_label] = clutch_df
-            clutch_league_by_season[season_label] = compute_clutch_league_stats(clutch_df)
-            clutch_fetched += 1
-            if clutch_fetched % 5 == 0:
-                print(f"  Fetched clutch data for {clutch_fetched} seasons...")
-            time.sleep(0.6)  # rate limit
+    # Fetch concurrently under one shared rate limit; league stats are
+    # computed on the main thread as each season arrives
+    limiter = RateLimiter(CLUTCH_FETCH_RATE)
+    with ThreadPoolExecutor(max_workers=CLUTCH_FETCH_WORKERS) as pool:
+        futures = {
+            pool.submit(fetch_clutch_stats, season_label, limiter=limiter): season_label
+            for season_label in sorted(all_season_labels)
+        }
+        for future in as_completed(futures):
+            season_label = futures[future]
+            clutch_df = future.result()
+            if clutch_df is not None and not clutch_df.empty:
+                clutch_by_season[season_label] = clutch_df
+                clutch_league_by_season[season_label] = compute_clutch_league_stats(clutch_df)
+                clutch_fetched += 1
+                if clutch_fetched % 5 == 0:
+                    print(f"  Fetched clutch data for {clutch_fetched} seasons...")
+
+    # Keep downstream processing in season order regardless of arrival order
+    clutch_by_season = dict(sorted(clutch_by_season.items()))
 
     print(f"  ✅ Fetched clutch stats for {clutch_fetched} seasons")
 
@@ -836,52 +889,62 @@ def run_ingestion(top_n: int = 100, min_seasons: int = 5, recent_seasons: int =
     # Build nba_api_id → bbref_id mapping for season-level attachment
     id_to_bbref = {p["nba_api_id"]: p["bbref_id"] for p in players_regular}
 
-    cpmi_computed = 0
-    for season_label, clutch_df in clutch_by_season.items():
-        league_stats = clutch_league_by_season[season_label]
-
-        for _, crow in clutch_df.iterrows():
-            pid = int(crow.get("PLAYER_ID", 0))
-            clutch_row = build_clutch_row(crow)
-            cpmi = compute_cpmi(clutch_row, league_stats)
-
-            # Attach CPMI to this player's season data (O(1) lookup)
-            bbref_id = id_to_bbref.get(pid)
-            if bbref_id and bbref_id in seasons_regular:
-                for s in seasons_regular[bbref_id]:
-                    if s.get("season") == season_label:
-                        s["cpmi"] = cpmi
-
-            # Accumulate per-player clutch data for career CPMI
-            if pid in reg_by_id:
-                p = reg_by_id[pid]
-                if "clutch_seasons" not in p:
-                    p["clutch_seasons"] = []
-                p["clutch_seasons"].append({
-                    "season": season_label,
-                    "cpmi": cpmi,
-                    "clutch_gp": clutch_row.get("clutch_gp", 0),
-                    "clutch_min": clutch_row.get("clutch_min", 0),
-                })
-                cpmi_computed += 1
-
-    # Compute career CPMI (clutch-minutes-weighted average)
+    # Score every season in one vectorized pass each and stack the results
+    # into a single columnar frame: one row per (player, season)
+    cpmi_frames = [
+        pd.DataFrame({
+            "player_id": clutch_df["PLAYER_ID"].fillna(0).astype(int).to_numpy(),
+            "season": season_label,
+            "cpmi": compute_cpmi_batch(clutch_df, clutch_league_by_season[season_label]),
+            "clutch_gp": clutch_df["GP"].fillna(0).astype(int).to_numpy(),
+            "clutch_min": clutch_df["MIN"].fillna(0).astype(float).to_numpy(),
+        })
+        for season_label, clutch_df in clutch_by_season.items()
+    ]
+    if cpmi_frames:
+        cpmi_df = pd.concat(cpmi_frames, ignore_index=True)
+    else:
+        cpmi_df = pd.DataFrame(columns=["player_id", "season", "cpmi", "clutch_gp", "clutch_min"])
+    cpmi_df["bbref_id"] = cpmi_df["player_id"].map(id_to_bbref)
+
+    # Attach CPMI to season rows with a single (bbref_id, season) join
+    matched = cpmi_df.dropna(subset=["bbref_id"])
+    cpmi_lookup = dict(zip(
+        zip(matched["bbref_id"], matched["season"]), matched["cpmi"].tolist()
+    ))
+    for bbref_id, season_rows in seasons_regular.items():
+        for s in season_rows:
+            cpmi = cpmi_lookup.get((bbref_id, s.get("season")))
+            if cpmi is not None:
+                s["cpmi"] = cpmi
+
+    # Career CPMI (clutch-minutes-weighted average, plain mean if no minutes)
+    ours = cpmi_df[cpmi_df["player_id"].isin(list(reg_by_id))]
+    cpmi_computed = len(ours)
+    # Dense player index → one bincount per reduction covers every player
+    pidx, pids = pd.factorize(ours["player_id"])
+    n_players = len(pids)
+    cpmi_vals = ours["cpmi"].to_numpy(dtype=float)
+    min_vals = ours["clutch_min"].to_numpy(dtype=float)
+    num = np.bincount(pidx, weights=cpmi_vals * min_vals, minlength=n_players)
+    den = np.bincount(pidx, weights=min_vals, minlength=n_players)
+    counts = np.bincount(pidx, minlength=n_players)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        career_cpmi = np.where(
+            den > 0, num / den,
+            np.bincount(pidx, weights=cpmi_vals, minlength=n_players) / counts,
+        )
+    career_by_id = dict(zip(
+        pids.tolist(), zip(career_cpmi.tolist(), counts.tolist())
+    ))
+
     for p in players_regular:
-        clutch_seasons = p.pop("clutch_seasons", [])
-        if not clutch_seasons:
+        entry = career_by_id.get(p["nba_api_id"])
+        if entry is None:
             p["cpmi"] = None
             continue
-
-        total_clutch_min = sum(cs.get("clutch_min", 0) for cs in clutch_seasons)
-        if total_clutch_min > 0:
-            career_cpmi = sum(
-                cs["cpmi"] * cs.get("clutch_min", 1) for cs in clutch_seasons
-            ) / total_clutch_min
-        else:
-            career_cpmi = sum(cs["cpmi"] for cs in clutch_seasons) / len(clutch_seasons)
-
-        p["cpmi"] = round(career_cpmi, 2)
-        p["clutch_seasons_count"] = len(clutch_seasons)
+        p["cpmi"] = round(entry[0], 2)
+        p["clutch_seasons_count"] = entry[1]
 
     print(f"  ✅ Computed CPMI for {cpmi_computed} player-seasons")
 
@@ -889,8 +952,8 @@ def run_ingestion(top_n: int = 100, min_seasons: int = 5, recent_seasons: int =
     print("\n💾 Step 5: Saving output files...")
 
     # Sort by career PMI (descending)
-    players_regular.sort(key=lambda p: p.get("pmi", 0), reverse=True)
-    players_playoffs.sort(key=lambda p: p.get("pmi", 0), reverse=True)
+    players_regular = _sort_by_pmi(players_regular)
+    players_playoffs = _sort_by_pmi(players_playoffs)
 
     def _write_json(data, filename):
         path = DATA_DIR / filename
@@ -23,7 +23,7 @@ Version history:
 import numpy as np
 import pandas as pd
 import logging
-from typing import Optional
+from typing import NamedTuple, Optional, Union
 
 logger = logging.getLogger(__name__)
 
@@ -88,6 +88,53 @@ CPMI_WEIGHTS = {
 }
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+#  LEAGUE STATS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class LeagueStats(NamedTuple):
+    """Per-season league mean/std for every z-scored stat.
+
+    Built once per season so the per-row OPMI/DPMI code reads attributes
+    instead of doing a dozen dict lookups with defaults per call. Field
+    defaults match the fallbacks the dict-based lookups used.
+    """
+    ppg_mean: float = 0
+    ppg_std: float = 1
+    apg_mean: float = 0
+    apg_std: float = 1
+    tov_pg_mean: float = 0
+    tov_pg_std: float = 1
+    orb_pg_mean: float = 0
+    orb_pg_std: float = 1
+    fta_pg_mean: float = 0
+    fta_pg_std: float = 1
+    fg3m_pg_mean: float = 0
+    fg3m_pg_std: float = 1
+    spg_mean: float = 0
+    spg_std: float = 1
+    bpg_mean: float = 0
+    bpg_std: float = 1
+    drb_pg_mean: float = 0
+    drb_pg_std: float = 1
+    pf_pg_mean: float = 0
+    pf_pg_std: float = 1
+    ts_pct_mean: float = 0.540
+    ts_pct_std: float = 1
+
+    @classmethod
+    def from_dict(cls, stats: dict) -> "LeagueStats":
+        """Build from a compute_season_league_stats-style dict."""
+        return cls(**{k: stats[k] for k in cls._fields if k in stats})
+
+
+def _as_league_stats(league_stats: Union[dict, LeagueStats]) -> LeagueStats:
+    """Accept either form; dicts are converted (callers should do it once)."""
+    if isinstance(league_stats, LeagueStats):
+        return league_stats
+    return LeagueStats.from_dict(league_stats)
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 #  HELPERS
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -112,10 +159,17 @@ def _interp_weights(guard_w: dict, center_w: dict, t: float) -> dict:
 
 
 def _z(val, mean, std):
-    """Z-score, clamped to [-3, 3]."""
-    if std == 0 or pd.isna(val) or pd.isna(mean):
+    """Z-score, clamped to [-3, 3].
+
+    NaN checks use ``x != x`` (pandas NaN is IEEE NaN) instead of
+    pd.isna, which is far slower per scalar call.
+    """
+    if std == 0 or val is None or val != val or mean is None or mean != mean:
         return 0.0
-    return max(-3.0, min(3.0, (val - mean) / std))
+    z = (val - mean) / std
+    if z < 3.0:
+        return z if z > -3.0 else -3.0
+    return 3.0
 
 
 def _era_multiplier(season_year: int) -> float:
@@ -131,13 +185,13 @@ def _era_multiplier(season_year: int) -> float:
 #  OPMI — Offensive Player Metric Index
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def compute_opmi(row: dict, league_stats: dict, pos_num: float,
+def compute_opmi(row: dict, league_stats: Union[dict, LeagueStats], pos_num: float,
                  is_playoff: bool = False, season_year: int = 2024) -> float:
     """Compute OPMI for a single player-season row.
 
     Args:
         row: Player stat dict with ppg, apg, ts_pct, tov_pg, orb_pg, fta_pg, fg3m_pg
-        league_stats: Dict with mean/std for each stat across the season
+        league_stats: LeagueStats (or equivalent dict) for the season
         pos_num: Numeric position (1-5)
         is_playoff: Whether this is playoff data
         season_year: Start year of season (for era penalty)
@@ -145,6 +199,7 @@ def compute_opmi(row: dict, league_stats: dict, pos_num: float,
     Returns:
         OPMI value (float)
     """
+    lg = _as_league_stats(league_stats)
     t = _pos_interp(pos_num)
     w = _interp_weights(W_GUARD, W_CENTER, t)
 
@@ -154,16 +209,16 @@ def compute_opmi(row: dict, league_stats: dict, pos_num: float,
         w["ts_diff"] *= PLAYOFF_TS_DIFF_MULT  # efficiency less differentiating in playoffs
 
     # Z-scores
-    z_pts = _z(row.get("ppg", 0), league_stats.get("ppg_mean", 0), league_stats.get("ppg_std", 1))
-    z_ast = _z(row.get("apg", 0), league_stats.get("apg_mean", 0), league_stats.get("apg_std", 1))
-    z_tov = _z(row.get("tov_pg", 0), league_stats.get("tov_pg_mean", 0), league_stats.get("tov_pg_std", 1))
-    z_orb = _z(row.get("orb_pg", 0), league_stats.get("orb_pg_mean", 0), league_stats.get("orb_pg_std", 1))
-    z_fta = _z(row.get("fta_pg", 0), league_stats.get("fta_pg_mean", 0), league_stats.get("fta_pg_std", 1))
-    z_fg3m = _z(row.get("fg3m_pg", 0), league_stats.get("fg3m_pg_mean", 0), league_stats.get("fg3m_pg_std", 1))
+    z_pts = _z(row.get("ppg", 0), lg.ppg_mean, lg.ppg_std)
+    z_ast = _z(row.get("apg", 0), lg.apg_mean, lg.apg_std)
+    z_tov = _z(row.get("tov_pg", 0), lg.tov_pg_mean, lg.tov_pg_std)
+    z_orb = _z(row.get("orb_pg", 0), lg.orb_pg_mean, lg.orb_pg_std)
+    z_fta = _z(row.get("fta_pg", 0), lg.fta_pg_mean, lg.fta_pg_std)
+    z_fg3m = _z(row.get("fg3m_pg", 0), lg.fg3m_pg_mean, lg.fg3m_pg_std)
 
     # True shooting diff vs league average
     ts_pct = row.get("ts_pct", 0) or 0
-    lg_ts = league_stats.get("ts_pct_mean", 0.540) or 0.540
+    lg_ts = lg.ts_pct_mean or 0.540
     ts_diff = ts_pct - lg_ts
 
     # ── Special Adjustments ──
@@ -208,7 +263,7 @@ def compute_opmi(row: dict, league_stats: dict, pos_num: float,
 #  DPMI — Defensive Player Metric Index
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def compute_dpmi(row: dict, league_stats: dict, pos_num: float,
+def compute_dpmi(row: dict, league_stats: Union[dict, LeagueStats], pos_num: float,
                  is_playoff: bool = False) -> float:
     """Compute DPMI for a single player-season row.
 
@@ -217,7 +272,7 @@ def compute_dpmi(row: dict, league_stats: dict, pos_num: float,
 
     Args:
         row: Player stat dict with spg, bpg, drb_pg, pf_pg
-        league_stats: Dict with mean/std for defensive stats
+        league_stats: LeagueStats (or equivalent dict) for the season
         pos_num: Numeric position (1-5)
         is_playoff: Whether this is playoff data
 
@@ -237,13 +292,14 @@ def compute_dpmi(row: dict, league_stats: dict, pos_num: float,
     if spg_val == 0 and bpg_val == 0 and drb == 0:
         return 0.0
 
+    lg = _as_league_stats(league_stats)
     t = _pos_interp(pos_num)
     w = _interp_weights(W_DPMI_GUARD, W_DPMI_CENTER, t)
 
-    z_stl = _z(spg_val, league_stats.get("spg_mean", 0), league_stats.get("spg_std", 1))
-    z_blk = _z(bpg_val, league_stats.get("bpg_mean", 0), league_stats.get("bpg_std", 1))
-    z_drb = _z(row.get("drb_pg", 0), league_stats.get("drb_pg_mean", 0), league_stats.get("drb_pg_std", 1))
-    z_pf = _z(row.get("pf_pg", 0), league_stats.get("pf_pg_mean", 0), league_stats.get("pf_pg_std", 1))
+    z_stl = _z(spg_val, lg.spg_mean, lg.spg_std)
+    z_blk = _z(bpg_val, lg.bpg_mean, lg.bpg_std)
+    z_drb = _z(row.get("drb_pg", 0), lg.drb_pg_mean, lg.drb_pg_std)
+    z_pf = _z(row.get("pf_pg", 0), lg.pf_pg_mean, lg.pf_pg_std)
 
     dpmi_raw = (
         w["z_stl"] * z_stl +
@@ -259,44 +315,47 @@ def compute_dpmi(row: dict, league_stats: dict, pos_num: float,
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
-#  ML IMPUTATION — Pre-1973 DPMI via GradientBoosting
+#  ML IMPUTATION — Pre-1973 DPMI via HistGradientBoosting
 # ═══════════════════════════════════════════════════════════════════════════════
 
 def train_dpmi_imputer(season_stats_df: pd.DataFrame) -> Optional[object]:
-    """Train a GradientBoostingRegressor on post-1973 data to predict DPMI.
+    """Train a HistGradientBoostingRegressor on post-1973 data to predict DPMI.
 
     Features: trb_rate, pf_rate, team_win_pct, mpg, is_center, era
     Target:   Known DPMI from post-1973 seasons
+    Missing feature values are left as NaN (handled natively by the
+    histogram learner); absent feature columns are filled with 0.
 
     Returns trained model or None if insufficient data.
     """
     try:
-        from sklearn.ensemble import GradientBoostingRegressor
+        from sklearn.ensemble import HistGradientBoostingRegressor
     except ImportError:
         logger.warning("scikit-learn not installed, ML DPMI imputation unavailable")
         return None
 
-    # Filter to post-1973 seasons with known DPMI
-    df = season_stats_df.copy()
-    df = df[df["season_year"] >= 1973]
-    df = df[df["dpmi"].notna() & (df["dpmi"] != 0)]
-    df = df[df["mpg"] > 10]  # min playing time
+    features = ["trb_rate", "pf_rate", "team_win_pct", "mpg", "is_center", "era"]
+
+    # Filter to post-1973 seasons with known DPMI in a single selection,
+    # keeping only the columns the model needs
+    src = season_stats_df
+    mask = (
+        (src["season_year"] >= 1973)
+        & src["dpmi"].notna() & (src["dpmi"] != 0)
+        & (src["mpg"] > 10)  # min playing time
+    )
+    present = [col for col in features if col in src.columns]
+    df = src.loc[mask, present + ["dpmi"]]
 
     if len(df) < 100:
         logger.warning(f"Only {len(df)} post-73 rows for DPMI training, need 100+")
         return None
 
-    features = ["trb_rate", "pf_rate", "team_win_pct", "mpg", "is_center", "era"]
-    for col in features:
-        if col not in df.columns:
-            df[col] = 0
-
-    X = df[features].fillna(0).values
+    X = df.reindex(columns=features, fill_value=0).values
     y = df["dpmi"].values
 
-    model = GradientBoostingRegressor(
-        n_estimators=200, max_depth=4, learning_rate=0.08,
-        subsample=0.8, random_state=42
+    model = HistGradientBoostingRegressor(
+        max_iter=200, max_depth=4, learning_rate=0.08, random_state=42
     )
     model.fit(X, y)
     logger.info(f"DPMI imputer trained on {len(df)} rows, R²={model.score(X, y):.3f}")
@@ -338,6 +397,46 @@ def impute_dpmi_ml(row: dict, model, is_playoff: bool = False) -> float:
     return round(max(0, dpmi_pred), 4)
 
 
+def impute_dpmi_ml_batch(rows_df: pd.DataFrame, model,
+                         is_playoff: bool = False) -> np.ndarray:
+    """Batch version of impute_dpmi_ml: one model.predict for all rows.
+
+    Returns an array of imputed DPMI values aligned with rows_df.
+    """
+    n = len(rows_df)
+    if model is None or n == 0:
+        return np.zeros(n)
+
+    def _col(name, default):
+        if name in rows_df.columns:
+            return rows_df[name].to_numpy(dtype=float)
+        return np.full(n, default, dtype=float)
+
+    trb_rate = _col("trb_rate", 0)
+    team_win = _col("team_win_pct", 0.5)
+    if "is_center" in rows_df.columns:
+        is_center = rows_df["is_center"].astype(bool).to_numpy(dtype=float)
+    else:
+        is_center = np.zeros(n)
+
+    X = np.column_stack([
+        trb_rate, _col("pf_rate", 0), team_win, _col("mpg", 30),
+        is_center, _col("era", 1960),
+    ])
+    dpmi_pred = model.predict(X)
+
+    # Elite historical defender boost
+    elite = (trb_rate > 0.35) & (team_win > 0.500)
+    boost = np.minimum(1.8, (trb_rate - 0.35) * 8.0 * (team_win - 0.500) * 3.0)
+    dpmi_pred = dpmi_pred + np.where(elite, boost, 0.0)
+
+    # Apply appropriate dampener
+    dampener_ratio = DPMI_DAMPENER_PLAYOFF / DPMI_DAMPENER_REG if is_playoff else 1.0
+    dpmi_pred *= dampener_ratio
+
+    return np.round(np.maximum(0, dpmi_pred), 4)
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 #  CPMI — Clutch Performance Metric Index
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -375,6 +474,18 @@ def compute_cpmi(clutch_row: dict, clutch_league: dict) -> float:
 #  CAREER AGGREGATION — Peak-weighted average + Bayesian regression
 # ═══════════════════════════════════════════════════════════════════════════════
 
+_PEAK_WEIGHTS: dict[int, tuple[np.ndarray, float]] = {}
+
+
+def _peak_weights(n: int) -> tuple[np.ndarray, float]:
+    """sqrt(N)..sqrt(1) rank weights and their sum, cached per career length."""
+    cached = _PEAK_WEIGHTS.get(n)
+    if cached is None:
+        weights = np.sqrt(np.arange(n, 0, -1, dtype=float))
+        cached = _PEAK_WEIGHTS[n] = (weights, float(weights.sum()))
+    return cached
+
+
 def compute_career_pmi(season_pmis: list[float], total_gp: int,
                        is_playoff: bool = False,
                        league_mean: float = 0.0) -> float:
@@ -388,18 +499,11 @@ def compute_career_pmi(season_pmis: list[float], total_gp: int,
         return 0.0
 
     # Sort descending (best first)
-    sorted_pmis = sorted(season_pmis, reverse=True)
-    n = len(sorted_pmis)
+    sorted_pmis = np.sort(np.asarray(season_pmis, dtype=float))[::-1]
 
     # Peak-weighted average: best season gets sqrt(N), worst gets sqrt(1)
-    total_weight = 0
-    weighted_sum = 0
-    for i, pmi in enumerate(sorted_pmis):
-        weight = np.sqrt(n - i)  # rank from best = i, so weight = sqrt(N - i)
-        weighted_sum += weight * pmi
-        total_weight += weight
-
-    career_avg = weighted_sum / total_weight if total_weight > 0 else 0
+    weights, total_weight = _peak_weights(len(sorted_pmis))
+    career_avg = float(weights @ sorted_pmis) / total_weight
 
     # Bayesian regression toward league mean
     gp_half = GP_HALF_PLAYOFF if is_playoff else GP_HALF_REG
@@ -459,44 +563,47 @@ def compute_pmi_for_season(season_df: pd.DataFrame, season_year: int,
         dpmi_model: Trained ML model for pre-1973 DPMI imputation
 
     Returns:
-        DataFrame with PMI columns added
+        A new DataFrame with the PMI columns added; season_df itself is
+        not modified
     """
     if season_df.empty:
         return season_df
 
-    df = season_df.copy()
-    league = compute_season_league_stats(df)
+    league = LeagueStats.from_dict(compute_season_league_stats(season_df))
 
-    opmis, dpmis, pmis, rts_pcts = [], [], [], []
+    opmis, dpmis, rts_pcts = [], [], []
 
-    for _, row in df.iterrows():
+    for _, row in season_df.iterrows():
         pos = _pos_num(row.get("position", "SF"))
         r = row.to_dict()
 
         # OPMI
-        opmi = compute_opmi(r, league, pos, is_playoff, season_year)
+        opmis.append(compute_opmi(r, league, pos, is_playoff, season_year))
 
         # DPMI
-        dpmi = compute_dpmi(r, league, pos, is_playoff)
-
-        # ML imputation for pre-1973 players with no defensive stats
-        if dpmi == 0 and season_year < 1973 and dpmi_model is not None:
-            dpmi = impute_dpmi_ml(r, dpmi_model, is_playoff)
-
-        pmi = round(opmi + dpmi, 4)
+        dpmis.append(compute_dpmi(r, league, pos, is_playoff))
 
         # Relative TS%
-        lg_ts = league.get("ts_pct_mean", 0.540)
-        rts = round((row.get("ts_pct", 0) or 0) - lg_ts, 4)
-
-        opmis.append(opmi)
-        dpmis.append(dpmi)
-        pmis.append(pmi)
-        rts_pcts.append(rts)
-
-    df["opmi"] = opmis
-    df["dpmi"] = dpmis
-    df["pmi"] = pmis
-    df["rts_pct"] = rts_pcts
-
-    return df
+        lg_ts = league.ts_pct_mean
+        rts_pcts.append(round((row.get("ts_pct", 0) or 0) - lg_ts, 4))
+
+    opmis = np.asarray(opmis, dtype=float)
+    dpmis = np.asarray(dpmis, dtype=float)
+
+    # ML imputation for pre-1973 players with no defensive stats,
+    # predicted in a single batch and scattered back
+    if season_year < 1973 and dpmi_model is not None:
+        impute_idx = np.flatnonzero(dpmis == 0)
+        if len(impute_idx):
+            dpmis[impute_idx] = impute_dpmi_ml_batch(
+                season_df.iloc[impute_idx], dpmi_model, is_playoff
+            )
+
+    # New frame; the caller's frame (possibly a slice of a larger one) is
+    # left untouched
+    return season_df.assign(
+        opmi=opmis,
+        dpmi=dpmis,
+        pmi=np.round(opmis + dpmis, 4),
+        rts_pct=rts_pcts,
+    )
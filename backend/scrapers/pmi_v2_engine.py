@@ -33,10 +33,23 @@ Version: 2.0
 Author: Samir Kerkar
 """
 
+import functools
 import numpy as np
 import pandas as pd
 import logging
-from typing import Optional
+from typing import Optional, Union
+
+from backend.scrapers.pmi_engine import LeagueStats, _as_league_stats
+
+try:  # optional: fused z-score/clip for large frames
+    import numexpr as ne
+except ImportError:
+    ne = None
+
+try:  # optional: compiled batch kernel
+    from numba import njit, prange
+except ImportError:
+    njit = None
 
 logger = logging.getLogger(__name__)
 
@@ -86,6 +99,11 @@ _RAW_WEIGHTS = {
 _MAX_W = max(abs(v) for v in _RAW_WEIGHTS.values())
 WEIGHTS = {k: v / _MAX_W for k, v in _RAW_WEIGHTS.items()}
 
+# Same weights as a frozen array for indexed / vectorized access
+_IDX = {"pts": 0, "ast": 1, "stl": 2, "blk": 3, "drb": 4, "orb": 5, "tov": 6, "pf": 7}
+_W = np.array([_RAW_WEIGHTS[k] for k in _IDX]) / _MAX_W
+_W.setflags(write=False)
+
 # Position encoding: PG=1, SG=2, SF=3, PF=4, C=5
 POS_MAP = {
     "PG": 1, "SG": 2, "G": 1.5, "Guard": 1.5,
@@ -110,6 +128,18 @@ POS_ADJUSTMENTS = {
     # pts, tov, pf: no position adjustment (equal for all positions)
 }
 
+# Position-adjusted weights precomputed for every position POS_MAP can
+# produce (PG=1.0 … C=5.0 in half steps); index = (pos_num - 1) * 2
+_POS_LEVELS = np.array([1.0, 1.5, 2.0, 2.5, 3.0, 3.5, 4.0, 4.5, 5.0])
+_POS_WEIGHT_TABLE = {}
+for _stat, _base in zip(_IDX, _W):
+    if _stat in POS_ADJUSTMENTS:
+        _g, _c = POS_ADJUSTMENTS[_stat]
+        _t = np.clip((_POS_LEVELS - 1) / 4, 0.0, 1.0)
+        _POS_WEIGHT_TABLE[_stat] = _base * ((1 - _t) * _g + _t * _c)
+    else:
+        _POS_WEIGHT_TABLE[_stat] = np.full_like(_POS_LEVELS, _base)
+
 # Efficiency bonus: TS% relative to league average
 # BPM uses USG% × (TS% - TmTS%) with complex interaction terms.
 # We simplify: bonus/penalty based on efficiency relative to league.
@@ -149,9 +179,16 @@ CPMI_WEIGHTS = {
 
 def _pos_num(pos_str: str) -> float:
     """Convert position string to numeric 1-5."""
-    if not pos_str or (isinstance(pos_str, float) and np.isnan(pos_str)):
+    # Non-strings (None, NaN, numbers) never match POS_MAP; only strings
+    # are parsed, and a league has ~20 distinct ones, so they're memoized
+    return _pos_num_cached(pos_str) if isinstance(pos_str, str) else 3.0
+
+
+@functools.lru_cache(maxsize=64)
+def _pos_num_cached(pos_str: str) -> float:
+    if not pos_str:
         return 3.0  # default SF
-    pos = str(pos_str).strip().upper().split("-")[0].split("/")[0]
+    pos = pos_str.strip().upper().split("-")[0].split("/")[0]
     return POS_MAP.get(pos, 3.0)
 
 
@@ -160,22 +197,53 @@ def _pos_interp(pos_num: float) -> float:
     return max(0.0, min(1.0, (pos_num - 1) / 4))
 
 
-def _z(val, mean, std):
-    """Z-score, clamped to [-3.5, 3.5].
+# Row count above which _z_col hands the arithmetic to numexpr
+_NUMEXPR_MIN_ROWS = 1000
+
+
+def _z_col(vals: np.ndarray, mean, std) -> np.ndarray:
+    """Array z-score, clamped to [-3.5, 3.5].
 
     Slightly wider clamp than v1 (-3 to 3) to let truly elite
     performances register without arbitrary ceiling.
+
+    mean/std may be scalars or per-column arrays that broadcast against
+    vals. NaN values, a zero std and a missing (None) mean all score 0.
+    Float32 input stays float32.
     """
-    if std == 0 or val is None or mean is None:
-        return 0.0
-    if isinstance(val, float) and np.isnan(val):
-        return 0.0
-    return max(-3.5, min(3.5, (float(val) - float(mean)) / float(std)))
+    dtype = vals.dtype if vals.dtype.kind == "f" else float
+    mean = np.asarray(mean, dtype=dtype)
+    std = np.asarray(std, dtype=dtype)
+    std = np.where(std == 0, np.nan, std)
+    if ne is not None and len(vals) > _NUMEXPR_MIN_ROWS:
+        return ne.evaluate(
+            "where(z != z, 0.0, where(z < -3.5, -3.5, where(z > 3.5, 3.5, z)))",
+            local_dict={"z": ne.evaluate("(v - m) / s",
+                                         local_dict={"v": vals, "m": mean, "s": std})},
+        )
+    # One fresh array from the broadcast, then clamp and zero NaNs in place
+    z = (vals - mean) / std
+    np.clip(z, -3.5, 3.5, out=z)
+    z[np.isnan(z)] = 0.0
+    return z
+
+
+def _pos_level_index(pos_nums: np.ndarray) -> Optional[np.ndarray]:
+    """Row indices into _POS_LEVELS, or None if any position is off-grid."""
+    idx = (pos_nums - 1) * 2
+    k = np.rint(idx)
+    if not np.all((k == idx) & (k >= 0) & (k < len(_POS_LEVELS))):
+        return None
+    return k.astype(np.intp)
 
 
 def _get_pos_weight(stat: str, pos_num: float) -> float:
     """Get position-adjusted weight for a stat."""
-    base = WEIGHTS.get(stat, 0)
+    k = (float(pos_num) - 1) * 2
+    if stat in _POS_WEIGHT_TABLE and k.is_integer() and 0 <= k < len(_POS_LEVELS):
+        return float(_POS_WEIGHT_TABLE[stat][int(k)])
+    # Off-grid positions fall back to direct interpolation
+    base = float(_W[_IDX[stat]]) if stat in _IDX else 0
     if stat not in POS_ADJUSTMENTS:
         return base
     guard_m, center_m = POS_ADJUSTMENTS[stat]
@@ -188,96 +256,370 @@ def _get_pos_weight(stat: str, pos_num: float) -> float:
 #  PMI COMPUTATION — Single unified metric (no separate OPMI/DPMI dampening)
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def compute_pmi_season(row: dict, league_stats: dict, pos_num: float) -> dict:
-    """Compute PMI for a single player-season.
+# Stats are at most ~40 with one decimal, so the batch path runs in
+# float32: half the memory traffic, twice the SIMD lanes
+_BATCH_DTYPE = np.float32
 
-    Returns dict with: pmi, opmi, dpmi (for display breakdown).
-    OPMI and DPMI are NOT separately dampened — they're just the
-    offensive and defensive components of the same unified metric.
+# (stat, column) pairs in the order the batch kernel stacks them. The
+# column name doubles as the league_stats key prefix.
+_OFF_COLS = (("pts", "ppg"), ("ast", "apg"), ("orb", "orb_pg"), ("tov", "tov_pg"))
+_DEF_COLS = (("stl", "spg"), ("blk", "bpg"), ("drb", "drb_pg"), ("pf", "pf_pg"))
+_BATCH_COLS = tuple(col for _, col in _OFF_COLS + _DEF_COLS) + ("ts_pct",)
 
-    Args:
-        row: Player stat dict (per-game)
-        league_stats: Dict with mean/std for each stat across the season
-        pos_num: Numeric position (1-5)
 
-    Returns:
-        {"pmi": float, "opmi": float, "dpmi": float}
+def _pos_weight_matrix(stats, pos_nums: np.ndarray) -> np.ndarray:
+    """Position-adjusted weights as an (n_players, n_stats) matrix.
+
+    Positions on the POS_MAP grid gather straight from _POS_WEIGHT_TABLE;
+    otherwise weights are evaluated once per distinct position and
+    gathered back to rows.
+    """
+    idx = _pos_level_index(pos_nums)
+    if idx is not None:
+        return np.stack([_POS_WEIGHT_TABLE.get(stat, np.zeros(len(_POS_LEVELS)))[idx]
+                         for stat in stats], axis=1)
+    levels, inverse = np.unique(pos_nums, return_inverse=True)
+    table = np.array([[_get_pos_weight(stat, float(p)) for stat in stats] for p in levels])
+    return table.reshape(len(levels), len(stats))[inverse.reshape(-1)]
+
+
+def _z_matrix(cols: dict, pairs, lg: LeagueStats, n: int) -> np.ndarray:
+    """Clamped z-scores for each (stat, column) pair as an (n, k) matrix.
+
+    A missing column reads as 0 (like row.get(col, 0)); see _z_col for
+    the remaining rules.
+    """
+    zeros = np.zeros(n, dtype=_BATCH_DTYPE)
+    V = np.stack([cols.get(col, zeros) for _, col in pairs], axis=1)
+    means = [getattr(lg, f"{col}_mean") for _, col in pairs]
+    stds = [getattr(lg, f"{col}_std") for _, col in pairs]
+    return _z_col(V, means, stds)
+
+
+def _weighted_z_sum(cols: dict, pairs, lg: LeagueStats, W: np.ndarray) -> np.ndarray:
+    """Row sums of W * clamped z, with 1/std folded into the weights.
+
+    w * clip((v - m) / s, ±3.5) == clip((w / s) * v - (w / s) * m, ±3.5|w|),
+    so each element costs one multiply-add plus the clamp. A zero/NaN
+    std or NaN mean zeroes the coefficient. Values must already be
+    NaN-free (compute_pmi_batch fills them at the boundary).
     """
-    # Z-scores for each box score stat
-    z_pts = _z(row.get("ppg", 0), league_stats.get("ppg_mean", 0), league_stats.get("ppg_std", 1))
-    z_ast = _z(row.get("apg", 0), league_stats.get("apg_mean", 0), league_stats.get("apg_std", 1))
-    z_tov = _z(row.get("tov_pg", 0), league_stats.get("tov_pg_mean", 0), league_stats.get("tov_pg_std", 1))
-    z_orb = _z(row.get("orb_pg", 0), league_stats.get("orb_pg_mean", 0), league_stats.get("orb_pg_std", 1))
-    z_stl = _z(row.get("spg", 0), league_stats.get("spg_mean", 0), league_stats.get("spg_std", 1))
-    z_blk = _z(row.get("bpg", 0), league_stats.get("bpg_mean", 0), league_stats.get("bpg_std", 1))
-    z_drb = _z(row.get("drb_pg", 0), league_stats.get("drb_pg_mean", 0), league_stats.get("drb_pg_std", 1))
-    z_pf  = _z(row.get("pf_pg", 0), league_stats.get("pf_pg_mean", 0), league_stats.get("pf_pg_std", 1))
+    n = W.shape[0]
+    zeros = np.zeros(n, dtype=_BATCH_DTYPE)
+    V = np.stack([cols.get(col, zeros) for _, col in pairs], axis=1)
+    W = W.astype(V.dtype, copy=False)
+    means = np.array([getattr(lg, f"{col}_mean") for _, col in pairs], dtype=V.dtype)
+    stds = np.array([getattr(lg, f"{col}_std") for _, col in pairs], dtype=V.dtype)
+    valid = (stds != 0) & ~np.isnan(stds) & ~np.isnan(means)
+    inv_std = np.divide(1.0, stds, out=np.zeros_like(stds), where=valid)
+    coef = W * inv_std
+    bias = -coef * np.where(valid, means, 0.0)
+    if __debug__:
+        assert not np.isnan(V).any(), "stat values must be NaN-filled upstream"
+    T = V * coef + bias
+    bound = 3.5 * np.abs(W)
+    np.clip(T, -bound, bound, out=T)
+    return T.sum(axis=1)
+
+
+def _guard_center_weights(pairs) -> tuple[np.ndarray, np.ndarray]:
+    """Position-adjusted weights at the guard (t=0) and center (t=1) ends."""
+    guard, center = [], []
+    for stat, _ in pairs:
+        guard_m, center_m = POS_ADJUSTMENTS.get(stat, (1.0, 1.0))
+        guard.append(guard_m)
+        center.append(center_m)
+    w = _W[[_IDX[stat] for stat, _ in pairs]]
+    return w * np.array(guard), w * np.array(center)
+
+
+_W_OFF_GUARD, _W_OFF_CENTER = _guard_center_weights(_OFF_COLS)
+_W_DEF_GUARD, _W_DEF_CENTER = _guard_center_weights(_DEF_COLS)
+
+
+if njit is not None:
+    # No nnan/ninf: a NaN ts_pct must still propagate to the output
+    @njit(parallel=True, cache=True,
+          fastmath={"nsz", "arcp", "contract", "afn", "reassoc"})
+    def _pmi_kernel(Z_off, Z_def, ts_diff, t,
+                    w_off_guard, w_off_center, w_def_guard, w_def_center):
+        n = Z_off.shape[0]
+        opmi = np.empty(n)
+        dpmi = np.empty(n)
+        for i in prange(n):
+            ti = t[i]
+            o = 0.0
+            for j in range(Z_off.shape[1]):
+                o += Z_off[i, j] * ((1 - ti) * w_off_guard[j] + ti * w_off_center[j])
+            d = 0.0
+            for j in range(Z_def.shape[1]):
+                d += Z_def[i, j] * ((1 - ti) * w_def_guard[j] + ti * w_def_center[j])
+            opmi[i] = o + EFFICIENCY_WEIGHT * ts_diff[i]
+            dpmi[i] = d
+        return opmi, dpmi
+else:
+    _pmi_kernel = None
+
+
+def _pmi_arrays(cols: dict, lg: LeagueStats, pos_nums: np.ndarray):
+    """Batch kernel: (pmi, opmi, dpmi) arrays for n players, unrounded."""
+    n = len(pos_nums)
 
     # Efficiency: TS% relative to league average
-    ts_pct = float(row.get("ts_pct", 0) or 0)
-    lg_ts = float(league_stats.get("ts_pct_mean", 0.540) or 0.540)
+    ts_pct = cols.get("ts_pct")
+    if ts_pct is None:
+        ts_pct = np.zeros(n, dtype=_BATCH_DTYPE)
+    lg_ts = float(lg.ts_pct_mean or 0.540)
     ts_diff = ts_pct - lg_ts
 
+    if _pmi_kernel is not None:
+        Z_off = _z_matrix(cols, _OFF_COLS, lg, n)
+        Z_def = _z_matrix(cols, _DEF_COLS, lg, n)
+        t = np.clip((pos_nums - 1) / 4, 0.0, 1.0)
+        opmi, dpmi = _pmi_kernel(Z_off, Z_def, ts_diff, t,
+                                 _W_OFF_GUARD, _W_OFF_CENTER, _W_DEF_GUARD, _W_DEF_CENTER)
+        return opmi + dpmi, opmi, dpmi
+
+    W_off = _pos_weight_matrix([stat for stat, _ in _OFF_COLS], pos_nums)
+    W_def = _pos_weight_matrix([stat for stat, _ in _DEF_COLS], pos_nums)
+
     # ── Offensive component ──
     # Scoring (pts z-score) + efficiency (TS diff) + creation (ast) + boards (orb)
-    # minus turnover cost, with position-adjusted weights
-    opmi = (
-        _get_pos_weight("pts", pos_num) * z_pts +
-        EFFICIENCY_WEIGHT * ts_diff +
-        _get_pos_weight("ast", pos_num) * z_ast +
-        _get_pos_weight("orb", pos_num) * z_orb +
-        WEIGHTS["tov"] * z_tov  # turnovers hurt equally regardless of position
-    )
+    # minus turnover cost (tov has no position adjustment)
+    opmi = _weighted_z_sum(cols, _OFF_COLS, lg, W_off) + EFFICIENCY_WEIGHT * ts_diff
 
     # ── Defensive component ──
     # Steals + blocks + defensive rebounds - fouls
     # No dampener — defense counts at its full empirical value
-    dpmi = (
-        _get_pos_weight("stl", pos_num) * z_stl +
-        _get_pos_weight("blk", pos_num) * z_blk +
-        _get_pos_weight("drb", pos_num) * z_drb +
-        WEIGHTS["pf"] * z_pf  # fouls hurt equally regardless of position
-    )
+    dpmi = _weighted_z_sum(cols, _DEF_COLS, lg, W_def)
+
+    return opmi + dpmi, opmi, dpmi
+
+
+def compute_pmi_batch(df: pd.DataFrame, league_stats: Union[dict, LeagueStats],
+                      pos_nums, decimals: Optional[int] = 2) -> pd.DataFrame:
+    """Compute PMI for every player-season in a DataFrame at once.
+
+    Vectorized form of compute_pmi_season: z-scores are computed per
+    column over the whole frame and combined with a per-player
+    position-adjusted weight matrix.
+
+    Args:
+        df: Per-game stats, one row per player-season
+        league_stats: LeagueStats (or dict) with mean/std for each stat
+        pos_nums: Numeric position (1-5) per row, aligned with df
+        decimals: Display rounding; None keeps full precision for
+            downstream aggregation (e.g. compute_career_pmi)
+
+    Returns:
+        DataFrame indexed like df with pmi, opmi, dpmi columns
+    """
+    lg = _as_league_stats(league_stats)
+
+    # Validate once at the boundary: a missing stat is filled with the
+    # league mean, i.e. z = 0 exactly as the per-value NaN rule gave, so
+    # the kernels do pure arithmetic. A missing TS% still yields NaN PMI.
+    cols = {}
+    for c in _BATCH_COLS:
+        if c not in df.columns:
+            continue
+        vals = df[c].to_numpy(dtype=_BATCH_DTYPE)
+        if c != "ts_pct":
+            mean = getattr(lg, f"{c}_mean")
+            fill = 0.0 if mean is None or mean != mean else mean
+            vals = np.where(np.isnan(vals), fill, vals)
+        cols[c] = vals
+
+    pmi, opmi, dpmi = _pmi_arrays(cols, lg, np.asarray(pos_nums, dtype=float))
+    # Back to float64 before rounding so the 2-decimal values are exact
+    out = np.column_stack([pmi, opmi, dpmi]).astype(np.float64)
+    if decimals is not None:
+        np.round(out, decimals, out=out)
+    return pd.DataFrame(out, columns=["pmi", "opmi", "dpmi"], index=df.index)
+
+
+# Field order of the packed single-season API. stats_tuple follows
+# _PACKED_COLS; league_tuple is (mean, std) per stat column, then
+# ts_pct_mean.
+_PACKED_COLS = ("ppg", "apg", "tov_pg", "orb_pg", "spg", "bpg", "drb_pg", "pf_pg", "ts_pct")
+
+
+
+def _z_scalar(val: float, mean: float, std: float) -> float:
+    """Scalar counterpart of _z_col for already-unpacked floats."""
+    if not std or std != std or val != val or mean != mean:
+        return 0.0
+    z = (val - mean) / std
+    return -3.5 if z < -3.5 else (3.5 if z > 3.5 else z)
+
+
+def _make_pmi_fn(pos_num: float):
+    """Single-season (opmi, dpmi) kernel with one position's weights baked in."""
+    w_pts, w_ast, w_orb, w_tov = (_get_pos_weight(stat, pos_num) for stat, _ in _OFF_COLS)
+    w_stl, w_blk, w_drb, w_pf = (_get_pos_weight(stat, pos_num) for stat, _ in _DEF_COLS)
+
+    def fn(s: tuple, lg: tuple) -> tuple:
+        # ── Offensive component ── (plus TS% relative to league average)
+        opmi = (w_pts * _z_scalar(s[0], lg[0], lg[1])
+                + w_ast * _z_scalar(s[1], lg[2], lg[3])
+                + w_orb * _z_scalar(s[3], lg[6], lg[7])
+                + w_tov * _z_scalar(s[2], lg[4], lg[5])
+                + EFFICIENCY_WEIGHT * (s[8] - (lg[16] or 0.540)))
+        # ── Defensive component ──
+        dpmi = (w_stl * _z_scalar(s[4], lg[8], lg[9])
+                + w_blk * _z_scalar(s[5], lg[10], lg[11])
+                + w_drb * _z_scalar(s[6], lg[12], lg[13])
+                + w_pf * _z_scalar(s[7], lg[14], lg[15]))
+        return opmi, dpmi
+
+    return fn
 
-    pmi = opmi + dpmi
 
-    return {
-        "pmi": round(pmi, 2),
-        "opmi": round(opmi, 2),
-        "dpmi": round(dpmi, 2),
-    }
+# One specialized kernel per _POS_LEVELS entry; index = (pos_num - 1) * 2
+_PMI_FNS = tuple(_make_pmi_fn(float(p)) for p in _POS_LEVELS)
+
+
+def pack_season_row(row: dict) -> tuple:
+    """Player stat dict → stats_tuple for compute_pmi_season_packed.
+
+    From a DataFrame, df[list(_PACKED_COLS)].itertuples(index=False,
+    name=None) yields the same tuples without building dicts.
+    """
+    vals = []
+    for col in _PACKED_COLS[:-1]:
+        v = row.get(col, 0)
+        vals.append(np.nan if v is None else float(v))
+    vals.append(float(row.get("ts_pct", 0) or 0))
+    return tuple(vals)
+
+
+def pack_league_stats(league_stats: Union[dict, LeagueStats]) -> tuple:
+    """league_stats → league_tuple for compute_pmi_season_packed.
+
+    A missing (None) mean or std is stored as NaN, which scores 0.
+    """
+    lg = _as_league_stats(league_stats)
+    vals = []
+    for col in _PACKED_COLS[:-1]:
+        for v in (getattr(lg, f"{col}_mean"), getattr(lg, f"{col}_std")):
+            vals.append(np.nan if v is None else float(v))
+    vals.append(float(lg.ts_pct_mean or 0.540))
+    return tuple(vals)
+
+
+# Entries kept by the memoized packed kernels. A site refresh recomputes
+# the same player-seasons many times over; hits skip all arithmetic.
+_MEMO_SIZE = 50_000
+
+
+@functools.lru_cache(maxsize=_MEMO_SIZE)
+def compute_pmi_season_packed(stats_tuple: tuple, league_tuple: tuple,
+                              pos_num: float) -> tuple:
+    """Compute (pmi, opmi, dpmi) for one player-season from packed tuples.
+
+    Same math as compute_pmi_season, but reads fields by position instead
+    of by key. Build the inputs with pack_season_row / pack_league_stats
+    (or itertuples); pack the league once per season and reuse it.
+    Results are memoized on the tuples themselves.
+    """
+    k = (float(pos_num) - 1) * 2
+    if k.is_integer() and 0 <= k < len(_PMI_FNS):
+        fn = _PMI_FNS[int(k)]
+    else:
+        fn = _make_pmi_fn(pos_num)  # off-grid position: build on the fly
+    opmi, dpmi = fn(stats_tuple, league_tuple)
+
+    return round(opmi + dpmi, 2), round(opmi, 2), round(dpmi, 2)
+
+
+def compute_pmi_season(row: dict, league_stats: Union[dict, LeagueStats],
+                       pos_num: float) -> dict:
+    """Compute PMI for a single player-season.
+
+    Returns dict with: pmi, opmi, dpmi (for display breakdown).
+    OPMI and DPMI are NOT separately dampened — they're just the
+    offensive and defensive components of the same unified metric.
+    Dict wrapper over compute_pmi_season_packed.
+
+    Args:
+        row: Player stat dict (per-game)
+        league_stats: LeagueStats (or dict) with mean/std for each stat
+        pos_num: Numeric position (1-5)
+
+    Returns:
+        {"pmi": float, "opmi": float, "dpmi": float}
+    """
+    pmi, opmi, dpmi = compute_pmi_season_packed(
+        pack_season_row(row), pack_league_stats(league_stats), pos_num)
+    return {"pmi": pmi, "opmi": opmi, "dpmi": dpmi}
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 #  CPMI — Clutch Performance Metric Index
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# (weight key, clutch_row key, clutch_league key prefix)
+_CPMI_FIELDS = (
+    ("z_ppg", "clutch_ppg", "ppg"),
+    ("z_apg", "clutch_apg", "apg"),
+    ("z_ts", "clutch_ts", "ts"),
+    ("z_plusminus", "clutch_plusminus", "pm"),
+    ("z_spg", "clutch_spg", "spg"),
+    ("z_tovpg", "clutch_tovpg", "tov"),
+)
+
+
+_CPMI_WEIGHT_VEC = np.array([CPMI_WEIGHTS[w] for w, _, _ in _CPMI_FIELDS])
+
+
 def compute_cpmi(clutch_row: dict, clutch_league: dict) -> float:
     """Compute CPMI from clutch split data (last 5 min, ±5 pts)."""
-    z_ppg = _z(clutch_row.get("clutch_ppg", 0), clutch_league.get("ppg_mean", 0), clutch_league.get("ppg_std", 1))
-    z_apg = _z(clutch_row.get("clutch_apg", 0), clutch_league.get("apg_mean", 0), clutch_league.get("apg_std", 1))
-    z_ts = _z(clutch_row.get("clutch_ts", 0), clutch_league.get("ts_mean", 0), clutch_league.get("ts_std", 1))
-    z_pm = _z(clutch_row.get("clutch_plusminus", 0), clutch_league.get("pm_mean", 0), clutch_league.get("pm_std", 1))
-    z_spg = _z(clutch_row.get("clutch_spg", 0), clutch_league.get("spg_mean", 0), clutch_league.get("spg_std", 1))
-    z_tov = _z(clutch_row.get("clutch_tovpg", 0), clutch_league.get("tov_mean", 0), clutch_league.get("tov_std", 1))
-
-    cpmi_raw = (
-        CPMI_WEIGHTS["z_ppg"] * z_ppg +
-        CPMI_WEIGHTS["z_apg"] * z_apg +
-        CPMI_WEIGHTS["z_ts"] * z_ts +
-        CPMI_WEIGHTS["z_plusminus"] * z_pm +
-        CPMI_WEIGHTS["z_spg"] * z_spg +
-        CPMI_WEIGHTS["z_tovpg"] * z_tov
-    )
-
+    vals = tuple(np.nan if v is None else v
+                 for v in (clutch_row.get(key, 0) for _, key, _ in _CPMI_FIELDS))
+    means = tuple(np.nan if m is None else m
+                  for m in (clutch_league.get(f"{lg}_mean", 0) for _, _, lg in _CPMI_FIELDS))
+    stds = tuple(clutch_league.get(f"{lg}_std", 1) for _, _, lg in _CPMI_FIELDS)
+    return _cpmi_packed(vals, means, stds)
+
+
+@functools.lru_cache(maxsize=_MEMO_SIZE)
+def _cpmi_packed(vals: tuple, means: tuple, stds: tuple) -> float:
+    z = _z_col(np.array(vals, dtype=float), means, stds)
+    cpmi_raw = float(_CPMI_WEIGHT_VEC @ z)
     return round(cpmi_raw, 2)
 
 
+def compute_cpmi_batch(clutch_df: pd.DataFrame, clutch_league: dict) -> np.ndarray:
+    """Vectorized compute_cpmi: one (n, 6) z matrix times the weight vector.
+
+    Missing columns read as 0, like clutch_row.get(key, 0).
+    """
+    n = len(clutch_df)
+    zeros = np.zeros(n, dtype=_BATCH_DTYPE)
+    Z = np.stack([clutch_df[key].to_numpy(dtype=_BATCH_DTYPE) if key in clutch_df.columns
+                  else zeros for _, key, _ in _CPMI_FIELDS], axis=1)
+    means = [clutch_league.get(f"{lg}_mean", 0) for _, _, lg in _CPMI_FIELDS]
+    stds = [clutch_league.get(f"{lg}_std", 1) for _, _, lg in _CPMI_FIELDS]
+    Z = _z_col(Z, [np.nan if m is None else m for m in means], stds)
+    cpmi_raw = Z @ _CPMI_WEIGHT_VEC.astype(_BATCH_DTYPE)
+    return np.round(cpmi_raw.astype(np.float64), 2)
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 #  CAREER AGGREGATION — Minutes-weighted (not peak-weighted)
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def compute_career_pmi(season_data: list[dict], is_playoff: bool = False) -> float:
+def _career_col(season_data, key: str) -> np.ndarray:
+    """One career column as a float array; missing/None values read as 0."""
+    if isinstance(season_data, pd.DataFrame):
+        if key not in season_data.columns:
+            return np.zeros(len(season_data))
+        return np.nan_to_num(season_data[key].to_numpy(dtype=np.float64))
+    return np.fromiter((s.get(key, 0) or 0 for s in season_data),
+                       dtype=np.float64, count=len(season_data))
+
+
+def compute_career_pmi(season_data, is_playoff: bool = False) -> float:
     """Compute career PMI using minutes-weighted average.
 
     Unlike v1's peak-weighted system (which inflated star players),
@@ -289,35 +631,30 @@ def compute_career_pmi(season_data: list[dict], is_playoff: bool = False) -> flo
     Also applies Bayesian GP regression toward 0.0 (league average).
 
     Args:
-        season_data: List of dicts with 'pmi', 'gp', 'mpg' keys
+        season_data: List of dicts with 'pmi', 'gp', 'mpg' keys, or a
+            DataFrame with those columns
         is_playoff: Whether this is playoff data
     """
-    if not season_data:
+    if season_data is None or len(season_data) == 0:
         return 0.0
 
-    total_minutes = 0
-    weighted_sum = 0
-
-    for s in season_data:
-        pmi = s.get("pmi", 0) or 0
-        gp = s.get("gp", 0) or 0
-        mpg = s.get("mpg", 0) or 0
-        minutes = gp * mpg
-        weighted_sum += pmi * minutes
-        total_minutes += minutes
+    pmis = _career_col(season_data, "pmi")
+    gps = _career_col(season_data, "gp")
+    minutes = gps * _career_col(season_data, "mpg")
 
+    total_minutes = minutes.sum()
     if total_minutes == 0:
         return 0.0
 
-    career_avg = weighted_sum / total_minutes
+    career_avg = (pmis * minutes).sum() / total_minutes
 
     # Bayesian regression toward league mean (0.0)
-    total_gp = sum(s.get("gp", 0) or 0 for s in season_data)
+    total_gp = gps.sum()
     gp_half = GP_HALF_PLAYOFF if is_playoff else GP_HALF_REG
     trust = total_gp / (total_gp + gp_half)
     career_pmi = trust * career_avg + (1 - trust) * 0.0
 
-    return round(career_pmi, 2)
+    return round(float(career_pmi), 2)
 
 
 def compute_awc(pmi: float, total_minutes: int) -> float:
@@ -334,39 +671,73 @@ def compute_awc(pmi: float, total_minutes: int) -> float:
 #  BATCH — Compute league stats for z-score normalization
 # ═══════════════════════════════════════════════════════════════════════════════
 
+_LEAGUE_COLS = ("ppg", "apg", "tov_pg", "orb_pg", "spg", "bpg", "drb_pg", "pf_pg", "ts_pct")
+
+
 def compute_season_league_stats(df: pd.DataFrame) -> dict:
     """Compute league mean/std for all stats needed for z-scores.
 
     Filters to players with meaningful minutes (>10 mpg) to avoid
     garbage-time players skewing the distribution.
     """
-    # Filter to meaningful minutes
-    work = df.copy()
-    if "mpg" in work.columns:
-        work = work[work["mpg"] >= 10]
-    if len(work) < 20:
-        work = df  # fallback if too few players pass filter
+    # Filter to meaningful minutes; boolean indexing already returns a
+    # new frame, and nothing below mutates it
+    if "mpg" in df.columns:
+        mask = df["mpg"].to_numpy() >= 10
+        work = df.loc[mask] if mask.sum() >= 20 else df  # fallback if too few pass
+    else:
+        work = df
+
+    # One aggregation pass for every column; NaNs are skipped like dropna()
+    present = [c for c in _LEAGUE_COLS if c in work.columns]
+    if not present:
+        return _league_stats_from_agg({}, {})
+    agg = work[present].agg(["mean", "std"])
+    return _league_stats_from_agg(agg.loc["mean"], agg.loc["std"])
+
+
+def compute_all_league_stats(big_df: pd.DataFrame,
+                             season_col: str = "season") -> dict:
+    """compute_season_league_stats for every season in one groupby pass.
+
+    Same rules per season: players under 10 mpg are dropped unless fewer
+    than 20 of that season's players remain, in which case the season
+    keeps all its rows.
 
+    Returns:
+        {season: league stats dict}
+    """
+    seasons = big_df[season_col].to_numpy()
+    if "mpg" in big_df.columns:
+        mask = big_df["mpg"].to_numpy() >= 10
+        passing = pd.Series(mask).groupby(seasons).transform("sum").to_numpy()
+        work = big_df.loc[mask | (passing < 20)]
+    else:
+        work = big_df
+
+    present = [c for c in _LEAGUE_COLS if c in work.columns]
+    if not present:
+        return {season: _league_stats_from_agg({}, {})
+                for season in pd.unique(seasons)}
+    agg = work.groupby(season_col)[present].agg(["mean", "std"])
+    means = agg.xs("mean", axis=1, level=1)
+    stds = agg.xs("std", axis=1, level=1)
+    return {season: _league_stats_from_agg(means.loc[season], stds.loc[season])
+            for season in agg.index}
+
+
+def _league_stats_from_agg(means, stds) -> dict:
+    """League stats dict from per-column mean/std mappings (missing → 0/1)."""
     stats = {}
-    for col, key in [
-        ("ppg", "ppg"), ("apg", "apg"), ("tov_pg", "tov_pg"),
-        ("orb_pg", "orb_pg"), ("spg", "spg"), ("bpg", "bpg"),
-        ("drb_pg", "drb_pg"), ("pf_pg", "pf_pg"),
-        ("ts_pct", "ts_pct"),
-    ]:
-        if col in work.columns:
-            vals = work[col].dropna()
-            if len(vals) > 0:
-                stats[f"{key}_mean"] = float(vals.mean())
-                stats[f"{key}_std"] = float(vals.std()) if len(vals) > 1 else 1.0
-                # Prevent zero std (which causes division errors)
-                if stats[f"{key}_std"] < 0.001:
-                    stats[f"{key}_std"] = 1.0
-            else:
-                stats[f"{key}_mean"] = 0
-                stats[f"{key}_std"] = 1
-        else:
-            stats[f"{key}_mean"] = 0
-            stats[f"{key}_std"] = 1
+    for col in _LEAGUE_COLS:
+        mean = float(means[col]) if col in means else np.nan
+        if np.isnan(mean):  # missing column or no non-null values
+            stats[f"{col}_mean"] = 0
+            stats[f"{col}_std"] = 1
+            continue
+        std = float(stds[col])
+        stats[f"{col}_mean"] = mean
+        # Single value (NaN std) or zero std would break z-scores
+        stats[f"{col}_std"] = std if std >= 0.001 else 1.0
 
     return stats
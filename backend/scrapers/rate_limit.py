@@ -0,0 +1,30 @@
+"""Request pacing shared by the concurrent nba_api fetchers.
+
+Used by the v1 clutch fetch (fetch_nba_data_v1) and the historical legends
+fetch (fetch_historical.py).
+"""
+
+import threading
+import time
+
+
+class RateLimiter:
+    """Thread-safe request pacer shared by concurrent API workers.
+
+    Hands out start slots at most `rate` per second across all threads,
+    so a small worker pool overlaps network latency without raising the
+    request rate NBA.com sees.
+    """
+
+    def __init__(self, rate: float):
+        self._interval = 1.0 / rate
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+        if slot > now:
+            time.sleep(slot - now)
@@ -0,0 +1,93 @@
+"""Scalar vs vectorized PMI v3 paths on rows with None values.
+
+Run from project root:
+  python -m pytest backend/tests
+"""
+
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.scrapers.pmi_v3_engine import (
+    compute_pmi_season,
+    compute_pmi_season_vec,
+    compute_pmi_seasons_batch,
+)
+
+LEAGUE = {
+    "ppg_mean": 9.5, "ppg_std": 6.0, "apg_mean": 2.1, "apg_std": 1.8,
+    "spg_mean": 0.7, "spg_std": 0.4, "bpg_mean": 0.45, "bpg_std": 0.5,
+    "drb_pg_mean": 2.6, "drb_pg_std": 1.6, "orb_pg_mean": 0.9, "orb_pg_std": 0.8,
+    "tov_pg_mean": 1.3, "tov_pg_std": 0.8, "pf_pg_mean": 1.9, "pf_pg_std": 0.7,
+    "ts_pct_mean": 0.545,
+}
+
+BASE_ROW = {
+    "ppg": 21.4, "apg": 5.2, "tov_pg": 2.6, "orb_pg": 1.1, "spg": 1.4,
+    "bpg": 0.6, "drb_pg": 4.8, "pf_pg": 2.4, "ts_pct": 0.581, "mpg": 34.2,
+}
+
+# None reads as 0 in spg/bpg/drb_pg/ts_pct/mpg and as "no data" elsewhere
+NONE_FIELDS = ["spg", "bpg", "drb_pg", "ts_pct", "mpg", "ppg", "tov_pg"]
+
+
+def _rows():
+    rows = [dict(BASE_ROW)]
+    for field in NONE_FIELDS:
+        rows.append({**BASE_ROW, field: None})
+    rows.append({**BASE_ROW, "spg": None, "bpg": None, "ts_pct": None})
+    return rows
+
+
+def _scalar(rows, pos_nums, years):
+    return np.array([
+        [compute_pmi_season(r, LEAGUE, p, y)[k] for k in ("pmi", "opmi", "dpmi")]
+        for r, p, y in zip(rows, pos_nums, years)
+    ])
+
+
+@pytest.mark.parametrize("field", NONE_FIELDS)
+def test_single_none_row_matches_scalar(field):
+    row = {**BASE_ROW, field: None}
+    expected = [compute_pmi_season(row, LEAGUE, 2.0, 1985)[k] for k in ("pmi", "opmi", "dpmi")]
+    got = compute_pmi_season_vec(pd.DataFrame([row]), LEAGUE, 2.0, 1985, dtype=np.float64)
+    assert all(math.isfinite(v) for v in expected)
+    np.testing.assert_allclose([g[0] for g in got], expected, rtol=0, atol=1e-9)
+
+
+def test_vec_matches_scalar_with_none_values():
+    rows = _rows()
+    n = len(rows)
+    pos_nums = np.linspace(1, 5, n)
+    expected = _scalar(rows, pos_nums, [1985] * n)
+    got = np.column_stack(compute_pmi_season_vec(
+        pd.DataFrame(rows, dtype=object), LEAGUE, pos_nums, 1985, dtype=np.float64))
+    assert np.isfinite(got).all()
+    np.testing.assert_allclose(got, expected, rtol=0, atol=1e-9)
+
+
+def test_batch_matches_scalar_with_none_values():
+    rows = _rows() * 2
+    n = len(rows)
+    pos_nums = np.linspace(1, 5, n)
+    years = np.array([1972, 2012] * (n // 2))
+    expected = _scalar(rows, pos_nums, years)
+    got = compute_pmi_seasons_batch(
+        pd.DataFrame(rows, dtype=object), {1972: LEAGUE, 2012: LEAGUE},
+        pos_nums, years, dtype=np.float64)
+    np.testing.assert_allclose(got, expected, rtol=0, atol=1e-9)
+    # float32 batch path: within one rounding step
+    got32 = compute_pmi_seasons_batch(
+        pd.DataFrame(rows, dtype=object), {1972: LEAGUE, 2012: LEAGUE},
+        pos_nums, years, dtype=np.float32)
+    np.testing.assert_allclose(got32, expected, rtol=0, atol=0.0101)
+
+
+def test_nan_stays_no_data():
+    # A real NaN (not None) is "no data" in both paths: z = 0
+    row = {**BASE_ROW, "spg": float("nan")}
+    expected = [compute_pmi_season(row, LEAGUE, 3.0, 2000)[k] for k in ("pmi", "opmi", "dpmi")]
+    got = compute_pmi_season_vec(pd.DataFrame([row]), LEAGUE, 3.0, 2000, dtype=np.float64)
+    np.testing.assert_allclose([g[0] for g in got], expected, rtol=0, atol=1e-9)
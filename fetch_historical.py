@@ -7,23 +7,44 @@ It outputs data in the SAME format as the existing pipeline's cached files,
 so it can be merged into _cached_players.json and _cached_season_data.json.
 
 Usage:
-    python fetch_historical.py [--output-dir DIR] [--delay SECS]
+    python fetch_historical.py [--output-dir DIR] [--delay SECS] [--workers N]
 
 Output:
     historical_players.json   — player dicts (same format as _cached_players.json)
-    historical_seasons.json   — season DataFrames as JSON (for league stat computation)
+    historical_seasons.json   — season columns as JSON {col: [values]}, 0.1-precision
+                                stats as ints ×10 (for league stat computation);
+                                .json.zst when zstandard is installed
 
 After running, merge into the main pipeline with:
     python merge_historical.py
 """
 
 import json
-import time
+import mmap
 import math
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 from collections import defaultdict
 
+import numpy as np
+import pandas as pd
+
+from backend.scrapers.rate_limit import RateLimiter
+
+try:  # optional: fast JSON codec for the multi-MB data files
+    import orjson
+except ImportError:
+    orjson = None
+
+try:  # optional: compressed historical_seasons.json.zst
+    import zstandard as zstd
+except ImportError:
+    zstd = None
+
+ZSTD_LEVEL = 3
+
 # ═══════════════════════════════════════════════════════════════════════════
 #  CURATED LEGENDS LIST — 112 historically significant pre-1996 players
 # ═══════════════════════════════════════════════════════════════════════════
@@ -160,11 +181,81 @@ def _sf(val, default=0.0):
         return default
 
 
+def _nan_to_none(obj):
+    """Copy of obj with non-finite floats as None, matching orjson's output."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {k: _nan_to_none(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_nan_to_none(v) for v in obj]
+    return obj
+
+
+def _json_bytes(obj, indent: bool = False) -> bytes:
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=str, option=option)
+    return json.dumps(_nan_to_none(obj), indent=2 if indent else None, default=str).encode()
+
+
+def _write_json(path: Path, obj, indent: bool = False):
+    """Write obj as JSON — orjson when installed, stdlib json otherwise.
+
+    Unknown types are written via str(), like json.dump(default=str).
+    Unlike json.dump, NaN and ±inf are written as null in both paths (orjson
+    can't emit NaN), so they load back as None, not float('nan').
+    Pass indent=True only for files meant to be read by a person.
+    A ".zst" path is zstd-compressed (requires zstandard).
+    """
+    data = _json_bytes(obj, indent)
+    if Path(path).suffix == ".zst":
+        data = zstd.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    Path(path).write_bytes(data)
+
+
+def _loads(buf, allow_nan: bool):
+    if not allow_nan:
+        return orjson.loads(buf)
+    try:
+        return orjson.loads(buf)
+    except orjson.JSONDecodeError:  # NaN/Infinity literals, valid for json
+        return json.loads(bytes(buf))
+
+
+def _read_json(path: Path, allow_nan: bool = False):
+    """Load a JSON file — orjson over a read-only mmap when installed.
+
+    orjson rejects the NaN/Infinity literals json.dump writes, so pass
+    allow_nan=True for files written that way (the fetch_nba_data caches);
+    those fall back to stdlib json when orjson can't decode them. ".zst"
+    files are decompressed first.
+    """
+    if Path(path).suffix == ".zst":
+        if zstd is None:
+            raise ImportError(f"zstandard is required to read {path}")
+        raw = zstd.ZstdDecompressor().decompress(Path(path).read_bytes())
+        return _loads(raw, allow_nan) if orjson is not None else json.loads(raw)
+    if orjson is None:
+        with open(path) as f:
+            return json.load(f)
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as buf:
+                return _loads(buf, allow_nan)
+
+
 def _season_label(year: int) -> str:
     """Convert year to 'YYYY-YY' format."""
     return f"{year}-{str(year + 1)[-2:]}"
 
 
+# _season_label for every BAA/NBA season, built once at import
+SEASON_LABEL = {y: _season_label(y) for y in range(1946, 2030)}
+
+
 def _bbref_id(name: str, nba_id: int) -> str:
     parts = name.strip().split()
     if len(parts) < 2:
@@ -174,6 +265,7 @@ def _bbref_id(name: str, nba_id: int) -> str:
     return f"{last}{first}01"
 
 
+@lru_cache(maxsize=128)
 def _pos_from_height(hi: int) -> str:
     if hi >= 82: return "C"
     elif hi >= 80: return "PF"
@@ -182,20 +274,54 @@ def _pos_from_height(hi: int) -> str:
     return "SF"
 
 
+# PlayerCareerStats per-game columns read by _parse_season_rows
+_STAT_COLS = ("PTS", "REB", "AST", "STL", "BLK", "MIN", "FG_PCT", "FGA", "FTA",
+              "FG3M", "TOV", "OREB", "DREB", "PF")
+
+
+def _stat_col(df, col):
+    """Column as Python floats with _sf's rules (missing/NaN/non-numeric → 0)."""
+    if col not in df.columns:
+        return [0.0] * len(df)
+    vals = pd.to_numeric(df[col], errors="coerce").to_numpy(dtype=np.float64)
+    return np.where(np.isnan(vals), 0.0, vals).tolist()
+
+
 def _parse_season_rows(df, stype_key):
-    """Parse PlayerCareerStats DataFrame rows into our season dict format."""
+    """Parse PlayerCareerStats DataFrame rows into our season dict format.
+
+    Each column is extracted once; the loop below unpacks one zipped tuple
+    per row.
+    """
+    n = len(df)
+    gps = df["GP"].tolist() if "GP" in df.columns else [0] * n
+    sids = df["SEASON_ID"].tolist() if "SEASON_ID" in df.columns else [""] * n
+    cols = {c: _stat_col(df, c) for c in _STAT_COLS}
+
+    # TS% for every row at once
+    pts_arr = np.array(cols["PTS"])
+    tsa_arr = 2 * (np.array(cols["FGA"]) + 0.44 * np.array(cols["FTA"]))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ts_all = np.where(tsa_arr > 0, pts_arr / tsa_arr, 0.0).tolist()
+    has_tsa = (tsa_arr > 0).tolist()
+
+    # Stat columns unpack in _STAT_COLS order
+    rows = zip(gps, sids, *(cols[c] for c in _STAT_COLS), ts_all, has_tsa)
+
     seasons = []
-    for _, row in df.iterrows():
-        gp = int(row.get("GP", 0) or 0)
+    for (gp, sid, ppg, rpg, apg, spg, bpg, mpg, fg_pct, fga, fta,
+         fg3m, tov, orb, drb, pf, ts, ts_ok) in rows:
+        gp = int(gp or 0)
         if gp == 0:
             continue
 
-        sid = str(row.get("SEASON_ID", ""))
+        sid = str(sid)
         if "-" in sid:
             label = sid
         elif len(sid) >= 4:
             try:
-                label = _season_label(int(sid[:4]))
+                start = int(sid[:4])
+                label = SEASON_LABEL.get(start) or _season_label(start)
             except:
                 continue
         else:
@@ -207,32 +333,13 @@ def _parse_season_rows(df, stype_key):
             continue
 
         # Per-game stats (PlayerCareerStats with PerGame returns per-game already)
-        ppg = _sf(row.get("PTS"))
-        rpg = _sf(row.get("REB"))
-        apg = _sf(row.get("AST"))
-        spg = _sf(row.get("STL"))
-        bpg = _sf(row.get("BLK"))
-        mpg = _sf(row.get("MIN"))
-        fg_pct = _sf(row.get("FG_PCT"))
-        fga = _sf(row.get("FGA"))
-        fta = _sf(row.get("FTA"))
-        fg3m = _sf(row.get("FG3M"))
-        tov = _sf(row.get("TOV"))
-        orb = _sf(row.get("OREB"))
-        drb = _sf(row.get("DREB"))
-        pf = _sf(row.get("PF"))
-
-        # TS%
-        tsa = 2 * (fga + 0.44 * fta)
-        ts = ppg / tsa if tsa > 0 else 0
-
         sd = {
             "season": label, "year": year, "gp": gp,
             "mpg": round(mpg, 1), "ppg": round(ppg, 1),
             "rpg": round(rpg, 1), "apg": round(apg, 1),
             "spg": round(spg, 1), "bpg": round(bpg, 1),
             "fg_pct": round(fg_pct, 4) if fg_pct else 0,
-            "ts_pct": round(ts, 4),
+            "ts_pct": round(ts, 4) if ts_ok else 0,
             "tov_pg": round(tov, 1), "orb_pg": round(orb, 1),
             "drb_pg": round(drb, 1), "fta_pg": round(fta, 1),
             "fg3m_pg": round(fg3m, 1), "pf_pg": round(pf, 1),
@@ -243,20 +350,195 @@ def _parse_season_rows(df, stype_key):
     return seasons
 
 
-def fetch_all_legends(delay=0.7, batch_seasons_already_fetched=None):
+# Season dict fields, in _parse_season_rows order; columns of the league pool
+_SEASON_ROW_FIELDS = ("season", "year", "gp", "mpg", "ppg", "rpg", "apg", "spg",
+                      "bpg", "fg_pct", "ts_pct", "tov_pg", "orb_pg", "drb_pg",
+                      "fta_pg", "fg3m_pg", "pf_pg", "fga_pg", "trb_pg")
+
+
+def _new_season_columns():
+    return {k: [] for k in _SEASON_ROW_FIELDS}
+
+
+# Fields rounded to 0.1 in _parse_season_rows; historical_seasons.json stores
+# them as exact integers ×10 under "<field>_x10"
+_X10_FIELDS = frozenset(("mpg", "ppg", "rpg", "apg", "spg", "bpg", "tov_pg",
+                         "orb_pg", "drb_pg", "fta_pg", "fg3m_pg", "pf_pg",
+                         "fga_pg", "trb_pg"))
+
+
+def _quantize_x10(cols):
+    """Season columns → JSON payload with 1-decimal fields as ints ×10."""
+    out = {}
+    for k, v in cols.items():
+        if k in _X10_FIELDS:
+            out[f"{k}_x10"] = np.rint(np.asarray(v, dtype=np.float64) * 10).astype(np.int64).tolist()
+        else:
+            out[k] = v
+    return out
+
+
+def _unscale(cols):
+    """Inverse of _quantize_x10; n / 10 gives back the same floats as round(x, 1).
+
+    Columns without the suffix pass through, so unquantized files still load.
+    """
+    out = {}
+    for k, v in cols.items():
+        if k.endswith("_x10"):
+            out[k[:-4]] = (np.asarray(v, dtype=np.float64) / 10).tolist()
+        else:
+            out[k] = v
+    return out
+
+
+# (totals key, per-game season key) for career totals
+_TOT_STATS = (("PTS", "ppg"), ("REB", "rpg"), ("AST", "apg"),
+              ("STL", "spg"), ("BLK", "bpg"), ("TOV", "tov_pg"))
+
+
+def _career_totals(seasons):
+    """Career totals from per-game seasons: Σ round(per_game × gp) per stat.
+
+    One (n_seasons, 6) matrix reduction; no seasons → {}.
+    """
+    if not seasons:
+        return {}
+    pg = np.array([[s[k] for _, k in _TOT_STATS] for s in seasons], dtype=np.float64)
+    gp = np.array([s["gp"] for s in seasons], dtype=np.float64)
+    sums = np.rint(pg * gp[:, None]).sum(axis=0).astype(np.int64).tolist()
+    return dict(zip((t for t, _ in _TOT_STATS), sums))
+
+
+# Concurrent PlayerCareerStats/CommonPlayerInfo workers. They share one
+# rate limiter, so requests start at most workers / delay per second overall.
+LEGEND_FETCH_WORKERS = 8
+
+# CommonPlayerInfo results per player id ({"pos", "hi"}), kept in the output
+# dir across runs — position and height of retired legends don't change
+INFO_CACHE_FILE = "_cpi_cache.json"
+
+# League pool output; main() appends ".zst" when zstandard is installed
+HIST_SEASONS_FILE = "historical_seasons.json"
+
+
+def _fetch_player_info(pid, limiter):
+    """CommonPlayerInfo → (position, height_inches, ok).
+
+    A failed request leaves the ("SF", 0) defaults and ok=False, so the
+    result is not cached.
+    """
+    from nba_api.stats.endpoints import commonplayerinfo
+
+    hi = 0
+    pos = "SF"
+    try:
+        limiter.wait()
+        pinfo = commonplayerinfo.CommonPlayerInfo(player_id=pid)
+        pi_df = pinfo.get_data_frames()[0]
+        if not pi_df.empty:
+            r = pi_df.iloc[0]
+            raw_pos = str(r.get("POSITION", "") or "")
+            if raw_pos:
+                pos = raw_pos.split("-")[0].strip()
+            ht = str(r.get("HEIGHT", "") or "")
+            if "-" in ht:
+                parts = ht.split("-")
+                try:
+                    hi = int(parts[0]) * 12 + int(parts[1])
+                except:
+                    pass
+    except:
+        return pos, hi, False
+    return pos, hi, True
+
+
+def _fetch_legend(pid, name, limiter, info_cache=None):
+    """Fetch and parse one legend → player_entry, or None if there's no data.
+
+    Every API request first takes a slot from the shared limiter. With an
+    info_cache dict, cached position/height skip the CommonPlayerInfo call
+    and fresh responses are added to it.
+    """
+    from nba_api.stats.endpoints import playercareerstats
+
+    limiter.wait()
+    career = playercareerstats.PlayerCareerStats(
+        player_id=pid, per_mode36="PerGame"
+    )
+
+    dfs = career.get_data_frames()
+    if not dfs or dfs[0].empty:
+        return None
+
+    reg_df = dfs[0]  # SeasonTotalsRegularSeason
+
+    # Get position info
+    key = str(pid)
+    cached = info_cache.get(key) if info_cache is not None else None
+    if cached is not None:
+        pos, hi = cached["pos"], cached["hi"]
+    else:
+        pos, hi, ok = _fetch_player_info(pid, limiter)
+        if ok and info_cache is not None:
+            info_cache[key] = {"pos": pos, "hi": hi}
+
+    if not pos or pos == "":
+        pos = _pos_from_height(hi)
+
+    # Parse regular season
+    regular = _parse_season_rows(reg_df, "regular")
+
+    # Parse playoffs (usually index 2)
+    playoffs = []
+    try:
+        if len(dfs) > 2 and not dfs[2].empty:
+            playoffs = _parse_season_rows(dfs[2], "playoffs")
+    except:
+        pass
+
+    # Compute totals
+    totals_reg = _career_totals(regular)
+    totals_ply = _career_totals(playoffs)
+
+    # Determine active status
+    years = sorted(set(s["year"] for s in regular))
+    is_active = years and years[-1] >= 2024
+
+    return {
+        "info": {
+            "nba_api_id": pid,
+            "full_name": name,
+            "is_active": is_active,
+            "position": pos,
+            "height": f"{hi // 12}-{hi % 12}" if hi > 0 else "",
+            "height_inches": hi,
+            "bbref_id": _bbref_id(name, pid),
+        },
+        "regular": regular,
+        "playoffs": playoffs,
+        "totals_regular": totals_reg,
+        "totals_playoffs": totals_ply,
+    }
+
+
+def fetch_all_legends(delay=0.7, batch_seasons_already_fetched=None,
+                      workers=LEGEND_FETCH_WORKERS, info_cache=None):
     """Fetch career stats for all curated legends.
     
     Args:
-        delay: Seconds between API calls
+        delay: Seconds between API calls per worker
         batch_seasons_already_fetched: set of season labels already in batch data
             (e.g. {'1996-97', '1997-98', ...}). If provided, we skip seasons
             that are already covered by batch LeagueDashPlayerStats.
+        workers: Concurrent fetch threads; 1 restores the serial request pace
+        info_cache: Optional {player_id: {"pos", "hi"}} CommonPlayerInfo cache,
+            read and filled in place
     """
-    from nba_api.stats.endpoints import playercareerstats, commonplayerinfo
-
     already_fetched = batch_seasons_already_fetched or set()
     players = {}
-    season_rows_by_year = defaultdict(list)  # for league stat computation
+    # League stat pool, column-wise: (stype, label) → {field: [values]}
+    season_rows_by_year = defaultdict(_new_season_columns)
     
     total = len(HISTORICAL_LEGENDS)
     fetched = 0
@@ -266,115 +548,46 @@ def fetch_all_legends(delay=0.7, batch_seasons_already_fetched=None):
     print(f"   Skipping seasons already in batch: {len(already_fetched)}")
     print("=" * 60)
 
-    for pid, name in HISTORICAL_LEGENDS.items():
-        fetched += 1
-        if fetched % 10 == 0 or fetched == 1:
-            print(f"  [{fetched}/{total}] {name}...")
-
-        try:
-            career = playercareerstats.PlayerCareerStats(
-                player_id=pid, per_mode36="PerGame"
-            )
-            time.sleep(delay)
-            
-            dfs = career.get_data_frames()
-            if not dfs or dfs[0].empty:
+    # Fetch concurrently under one shared rate limit
+    limiter = RateLimiter(workers / delay)
+    entries = {}
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(_fetch_legend, pid, name, limiter, info_cache): (pid, name)
+            for pid, name in HISTORICAL_LEGENDS.items()
+        }
+        for future in as_completed(futures):
+            pid, name = futures[future]
+            fetched += 1
+            if fetched % 10 == 0 or fetched == 1:
+                print(f"  [{fetched}/{total}] {name}...")
+            try:
+                entry = future.result()
+            except Exception as e:
+                print(f"    ❌ Error fetching {name}: {e}")
+                errors += 1
+                continue
+            if entry is None:
                 print(f"    ⚠️  No data for {name}")
                 errors += 1
                 continue
+            entries[pid] = entry
 
-            reg_df = dfs[0]  # SeasonTotalsRegularSeason
-            
-            # Get position info
-            hi = 0
-            pos = "SF"
-            try:
-                pinfo = commonplayerinfo.CommonPlayerInfo(player_id=pid)
-                time.sleep(delay)
-                pi_df = pinfo.get_data_frames()[0]
-                if not pi_df.empty:
-                    r = pi_df.iloc[0]
-                    raw_pos = str(r.get("POSITION", "") or "")
-                    if raw_pos:
-                        pos = raw_pos.split("-")[0].strip()
-                    ht = str(r.get("HEIGHT", "") or "")
-                    if "-" in ht:
-                        parts = ht.split("-")
-                        try:
-                            hi = int(parts[0]) * 12 + int(parts[1])
-                        except:
-                            pass
-            except:
-                pass
-
-            if not pos or pos == "":
-                pos = _pos_from_height(hi)
-
-            # Parse regular season
-            regular = _parse_season_rows(reg_df, "regular")
+    # Assemble in curated-list order regardless of arrival order
+    for pid in HISTORICAL_LEGENDS:
+        player_entry = entries.get(pid)
+        if player_entry is None:
+            continue
 
-            # Parse playoffs (usually index 2)
-            playoffs = []
-            try:
-                if len(dfs) > 2 and not dfs[2].empty:
-                    playoffs = _parse_season_rows(dfs[2], "playoffs")
-            except:
-                pass
-
-            # Compute totals
-            totals_reg = defaultdict(int)
-            totals_ply = defaultdict(int)
-            for s in regular:
-                gp = s["gp"]
-                totals_reg["PTS"] += int(round(s["ppg"] * gp))
-                totals_reg["REB"] += int(round(s["rpg"] * gp))
-                totals_reg["AST"] += int(round(s["apg"] * gp))
-                totals_reg["STL"] += int(round(s["spg"] * gp))
-                totals_reg["BLK"] += int(round(s["bpg"] * gp))
-                totals_reg["TOV"] += int(round(s["tov_pg"] * gp))
-            for s in playoffs:
-                gp = s["gp"]
-                totals_ply["PTS"] += int(round(s["ppg"] * gp))
-                totals_ply["REB"] += int(round(s["rpg"] * gp))
-                totals_ply["AST"] += int(round(s["apg"] * gp))
-                totals_ply["STL"] += int(round(s["spg"] * gp))
-                totals_ply["BLK"] += int(round(s["bpg"] * gp))
-                totals_ply["TOV"] += int(round(s["tov_pg"] * gp))
-
-            # Add season rows to league averages pool (only pre-batch seasons)
-            for s in regular:
-                if s["season"] not in already_fetched:
-                    season_rows_by_year[("regular", s["season"])].append(s)
-            for s in playoffs:
+        # Add season rows to league averages pool (only pre-batch seasons)
+        for stype in ("regular", "playoffs"):
+            for s in player_entry[stype]:
                 if s["season"] not in already_fetched:
-                    season_rows_by_year[("playoffs", s["season"])].append(s)
-
-            # Determine active status
-            years = sorted(set(s["year"] for s in regular))
-            is_active = years and years[-1] >= 2024
-
-            player_entry = {
-                "info": {
-                    "nba_api_id": pid,
-                    "full_name": name,
-                    "is_active": is_active,
-                    "position": pos,
-                    "height": f"{hi // 12}-{hi % 12}" if hi > 0 else "",
-                    "height_inches": hi,
-                    "bbref_id": _bbref_id(name, pid),
-                },
-                "regular": regular,
-                "playoffs": playoffs,
-                "totals_regular": dict(totals_reg),
-                "totals_playoffs": dict(totals_ply),
-            }
-
-            players[str(pid)] = player_entry
-
-        except Exception as e:
-            print(f"    ❌ Error fetching {name}: {e}")
-            errors += 1
-            continue
+                    cols = season_rows_by_year[(stype, s["season"])]
+                    for k in _SEASON_ROW_FIELDS:
+                        cols[k].append(s[k])
+
+        players[str(pid)] = player_entry
 
     # Summary
     total_reg = sum(len(p["regular"]) for p in players.values())
@@ -397,6 +610,7 @@ def main():
     parser = argparse.ArgumentParser(description="Fetch historical NBA legends")
     parser.add_argument("--output-dir", type=str, default="./backend/data")
     parser.add_argument("--delay", type=float, default=0.7)
+    parser.add_argument("--workers", type=int, default=LEGEND_FETCH_WORKERS)
     args = parser.parse_args()
 
     out_dir = Path(args.output_dir)
@@ -407,32 +621,43 @@ def main():
     batch_seasons = set()
     if cached_sd_path.exists():
         print("Loading batch season data to detect overlap...")
-        with open(cached_sd_path) as f:
-            sd_raw = json.load(f)
+        sd_raw = _read_json(cached_sd_path, allow_nan=True)
         for stype in ["regular", "playoffs"]:
             batch_seasons.update(sd_raw.get(stype, {}).keys())
         print(f"  Batch covers {len(batch_seasons)} season-types")
 
+    info_cache_path = out_dir / INFO_CACHE_FILE
+    info_cache = _read_json(info_cache_path) if info_cache_path.exists() else {}
+    if info_cache:
+        print(f"  {len(info_cache)} players cached in {info_cache_path.name}")
+
     players, season_rows = fetch_all_legends(
         delay=args.delay,
         batch_seasons_already_fetched=batch_seasons,
+        workers=args.workers,
+        info_cache=info_cache,
     )
+    _write_json(info_cache_path, info_cache)
 
     # Save
     hist_players_path = out_dir / "historical_players.json"
-    hist_seasons_path = out_dir / "historical_seasons.json"
+    # Compressed when zstandard is installed; drop the other variant so
+    # merge_historical can't pick up a stale file
+    hist_seasons_path = out_dir / (f"{HIST_SEASONS_FILE}.zst" if zstd is not None
+                                   else HIST_SEASONS_FILE)
 
-    with open(hist_players_path, "w") as f:
-        json.dump(players, f, indent=2, default=str)
+    _write_json(hist_players_path, players)
     print(f"\n💾 Saved {hist_players_path} ({hist_players_path.stat().st_size / 1024:.0f} KB)")
 
     # Convert season_rows keys to strings for JSON
     sr_serializable = {}
-    for (stype, label), rows in season_rows.items():
+    for (stype, label), cols in season_rows.items():
         key = f"{stype}|{label}"
-        sr_serializable[key] = rows
-    with open(hist_seasons_path, "w") as f:
-        json.dump(sr_serializable, f, indent=2, default=str)
+        sr_serializable[key] = _quantize_x10(cols)
+    _write_json(hist_seasons_path, sr_serializable)
+    for stale in (out_dir / HIST_SEASONS_FILE, out_dir / f"{HIST_SEASONS_FILE}.zst"):
+        if stale != hist_seasons_path and stale.exists():
+            stale.unlink()
     print(f"💾 Saved {hist_seasons_path} ({hist_seasons_path.stat().st_size / 1024:.0f} KB)")
 
     print(f"\nNext: run `python merge_historical.py` to merge into main pipeline data")
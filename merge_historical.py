@@ -4,46 +4,79 @@ Reads:
   - _cached_players.json (from batch pipeline, 1996-2024)
   - _cached_season_data.json (from batch pipeline)
   - historical_players.json (from fetch_historical.py)
-  - historical_seasons.json (from fetch_historical.py)
+  - historical_seasons.json[.zst] (from fetch_historical.py)
 
 Writes:
   - _cached_players.json (merged)
   - _cached_season_data.json (merged with historical season rows for league stats)
 
+_cached_season_data.json keeps the batch pipeline's layout: for each season
+type and season label, a list of LeagueDashPlayerStats records (one dict per
+player row), as written by fetch_nba_data.py. Historical seasons are built
+column-wise and converted to records before they are written, so every
+entry in the file has the same shape.
+
 After merging, re-run PMI computation:
   python -m backend.scrapers.fetch_nba_data --recompute
 """
 
-import json
 from pathlib import Path
 from collections import defaultdict
 
+from fetch_historical import HIST_SEASONS_FILE, _read_json, _unscale, _write_json
+
+STAT_KEYS = ("PTS", "REB", "AST", "STL", "BLK", "TOV")
+
+# (LeagueDashPlayerStats column, historical season field)
+API_COLUMNS = (("GP", "gp"), ("MIN", "mpg"), ("PTS", "ppg"), ("REB", "rpg"),
+               ("AST", "apg"), ("STL", "spg"), ("BLK", "bpg"), ("TOV", "tov_pg"),
+               ("OREB", "orb_pg"), ("DREB", "drb_pg"), ("PF", "pf_pg"),
+               ("FGA", "fga_pg"), ("FTA", "fta_pg"), ("FG_PCT", "fg_pct"),
+               ("FG3M", "fg3m_pg"))
+
+
+def _season_year(s):
+    return s.get("year", 0)
+
+
+def _merge_seasons(batch_rows, hist_rows):
+    """Batch season rows plus the historical seasons batch lacks, by year.
+
+    Batch rows win on a shared season; a season repeated in the historical
+    list keeps its first row.
+    """
+    # No historical rows (e.g. no playoff runs): nothing to dedupe
+    if not hist_rows:
+        return sorted(batch_rows, key=_season_year)
+    by_season = {s["season"]: s for s in batch_rows}
+    for s in hist_rows:
+        by_season.setdefault(s["season"], s)
+    return sorted(by_season.values(), key=_season_year)
+
 
 def main():
     data_dir = Path("./backend/data")
 
     # Load batch data
     print("Loading batch pipeline data...")
-    with open(data_dir / "_cached_players.json") as f:
-        batch_players = json.load(f)
-    with open(data_dir / "_cached_season_data.json") as f:
-        batch_sd = json.load(f)
+    batch_players = _read_json(data_dir / "_cached_players.json", allow_nan=True)
+    batch_sd = _read_json(data_dir / "_cached_season_data.json", allow_nan=True)
 
     print(f"  Batch: {len(batch_players)} players, "
           f"{len(batch_sd.get('regular', {}))} regular seasons")
 
     # Load historical data
     hist_players_path = data_dir / "historical_players.json"
-    hist_seasons_path = data_dir / "historical_seasons.json"
+    hist_seasons_path = data_dir / f"{HIST_SEASONS_FILE}.zst"
+    if not hist_seasons_path.exists():
+        hist_seasons_path = data_dir / HIST_SEASONS_FILE
 
     if not hist_players_path.exists():
         print("❌ historical_players.json not found. Run fetch_historical.py first.")
         return
 
-    with open(hist_players_path) as f:
-        hist_players = json.load(f)
-    with open(hist_seasons_path) as f:
-        hist_seasons_raw = json.load(f)
+    hist_players = _read_json(hist_players_path)
+    hist_seasons_raw = _read_json(hist_seasons_path)
 
     print(f"  Historical: {len(hist_players)} players")
 
@@ -59,35 +92,15 @@ def main():
         if pid_str in batch_players:
             # Merge: add historical seasons that aren't already in batch
             batch_p = batch_players[pid_str]
-            existing_seasons = {(s["season"], "regular") for s in batch_p.get("regular", [])}
-            existing_seasons.update({(s["season"], "playoffs") for s in batch_p.get("playoffs", [])})
-
-            for stype in ["regular", "playoffs"]:
-                for s in hist_p.get(stype, []):
-                    if (s["season"], stype) not in existing_seasons:
-                        batch_p[stype].append(s)
-                        existing_seasons.add((s["season"], stype))
-
-            # Sort seasons by year
-            batch_p["regular"].sort(key=lambda s: s.get("year", 0))
-            batch_p["playoffs"].sort(key=lambda s: s.get("year", 0))
-
-            # Merge totals
-            for stat in ["PTS", "REB", "AST", "STL", "BLK", "TOV"]:
-                batch_total = int(batch_p.get("totals_regular", {}).get(stat, 0) or 0)
-                hist_total = int(hist_p.get("totals_regular", {}).get(stat, 0) or 0)
-                # Use the larger total (historical has full career)
-                if hist_total > batch_total:
-                    if "totals_regular" not in batch_p:
-                        batch_p["totals_regular"] = {}
-                    batch_p["totals_regular"][stat] = hist_total
-
-                batch_total_p = int(batch_p.get("totals_playoffs", {}).get(stat, 0) or 0)
-                hist_total_p = int(hist_p.get("totals_playoffs", {}).get(stat, 0) or 0)
-                if hist_total_p > batch_total_p:
-                    if "totals_playoffs" not in batch_p:
-                        batch_p["totals_playoffs"] = {}
-                    batch_p["totals_playoffs"][stat] = hist_total_p
+            for stype in ("regular", "playoffs"):
+                batch_p[stype] = _merge_seasons(batch_p.get(stype, []), hist_p.get(stype, []))
+
+                # Merge totals: use the larger total (historical has full career)
+                tk = f"totals_{stype}"
+                batch_tot = batch_p.get(tk) or {}
+                hist_tot = hist_p.get(tk) or {}
+                batch_p[tk] = {k: max(int(batch_tot.get(k, 0) or 0), int(hist_tot.get(k, 0) or 0))
+                               for k in STAT_KEYS}
 
             # Update position/height if batch didn't have it
             if not batch_p.get("info", {}).get("height_inches"):
@@ -116,34 +129,25 @@ def main():
     for (stype, label), rows in hist_season_rows.items():
         if label not in batch_sd.get(stype, {}):
             # New season not in batch — add it
-            # Convert list of dicts to the DataFrame-record format batch expects
             if stype not in batch_sd:
                 batch_sd[stype] = {}
 
-            # Convert our internal format to match LeagueDashPlayerStats column names
-            api_rows = []
-            for r in rows:
-                api_rows.append({
-                    "PLAYER_ID": 0,  # placeholder
-                    "GP": r.get("gp", 0),
-                    "MIN": r.get("mpg", 0),
-                    "PTS": r.get("ppg", 0),
-                    "REB": r.get("rpg", 0),
-                    "AST": r.get("apg", 0),
-                    "STL": r.get("spg", 0),
-                    "BLK": r.get("bpg", 0),
-                    "TOV": r.get("tov_pg", 0),
-                    "OREB": r.get("orb_pg", 0),
-                    "DREB": r.get("drb_pg", 0),
-                    "PF": r.get("pf_pg", 0),
-                    "FGA": r.get("fga_pg", 0),
-                    "FTA": r.get("fta_pg", 0),
-                    "FG_PCT": r.get("fg_pct", 0),
-                    "FG3M": r.get("fg3m_pg", 0),
-                    "_SEASON": label,
-                    "_YEAR": r.get("year", 0),
-                })
-            batch_sd[stype][label] = api_rows
+            # Convert our internal format to match LeagueDashPlayerStats column
+            # names: built column-wise, then zipped into records
+            if isinstance(rows, list):  # row-wise file from an older fetch
+                n = len(rows)
+                rows = {col: [r.get(col, 0) for r in rows]
+                        for col in [c for _, c in API_COLUMNS] + ["year"]}
+            else:
+                rows = _unscale(rows)
+                n = len(next(iter(rows.values()), ()))
+            api_rows = {"PLAYER_ID": [0] * n}  # placeholder
+            for api_col, col in API_COLUMNS:
+                api_rows[api_col] = rows.get(col) or [0] * n
+            api_rows["_SEASON"] = [label] * n
+            api_rows["_YEAR"] = rows.get("year") or [0] * n
+            batch_sd[stype][label] = [dict(zip(api_rows, vals))
+                                      for vals in zip(*api_rows.values())]
             seasons_added += 1
 
     print(f"  Added {seasons_added} historical season-types for league stats")
@@ -153,13 +157,11 @@ def main():
     # --- Save merged data ---
     print("\n💾 Saving merged data...")
     
-    with open(data_dir / "_cached_players.json", "w") as f:
-        json.dump(batch_players, f, default=str)
+    _write_json(data_dir / "_cached_players.json", batch_players)
     sz = (data_dir / "_cached_players.json").stat().st_size / 1024 / 1024
     print(f"  _cached_players.json: {sz:.1f} MB")
 
-    with open(data_dir / "_cached_season_data.json", "w") as f:
-        json.dump(batch_sd, f, default=str)
+    _write_json(data_dir / "_cached_season_data.json", batch_sd)
     sz2 = (data_dir / "_cached_season_data.json").stat().st_size / 1024 / 1024
     print(f"  _cached_season_data.json: {sz2:.1f} MB")
 
@@ -170,15 +172,18 @@ def main():
     # Show some legendary names
     legends_check = ["Michael Jordan", "Kareem Abdul-Jabbar", "Wilt Chamberlain",
                      "Magic Johnson", "Larry Bird", "Bill Russell"]
+    # full_name → first player entry with that name
+    by_name = {}
+    for p in batch_players.values():
+        by_name.setdefault(p.get("info", {}).get("full_name"), p)
     for name in legends_check:
-        for pid_str, p in batch_players.items():
-            if p.get("info", {}).get("full_name") == name:
-                reg = len(p.get("regular", []))
-                ply = len(p.get("playoffs", []))
-                yrs = sorted(set(s.get("year", 0) for s in p.get("regular", [])))
-                yr_range = f"{yrs[0]}-{yrs[-1]}" if yrs else "?"
-                print(f"   ✅ {name}: {reg} reg + {ply} ply seasons ({yr_range})")
-                break
+        p = by_name.get(name)
+        if p is not None:
+            reg = len(p.get("regular", []))
+            ply = len(p.get("playoffs", []))
+            yrs = sorted(set(s.get("year", 0) for s in p.get("regular", [])))
+            yr_range = f"{yrs[0]}-{yrs[-1]}" if yrs else "?"
+            print(f"   ✅ {name}: {reg} reg + {ply} ply seasons ({yr_range})")
 
     print(f"\n🔄 Next: python -m backend.scrapers.fetch_nba_data --recompute")
 